@@ -1,5 +1,5 @@
 import math
-from collections import defaultdict
+from collections import Counter, defaultdict
 from datetime import datetime, timedelta, timezone
 
 from git_xrays.domain.models import (
@@ -180,7 +180,7 @@ def analyze_hotspots(
         from_date=since,
         to_date=now,
         total_commits=total_commits,
-        files=files,
+        files=tuple(files),
     )
 
 
@@ -205,7 +205,7 @@ def analyze_knowledge(
             repo_path=repo_path, window_days=window_days,
             from_date=since, to_date=now,
             total_commits=0, developer_risk_index=0.0,
-            knowledge_island_count=0, files=[],
+            knowledge_island_count=0, files=(),
         )
 
     total_commits = len({c.commit_hash for c in changes})
@@ -284,7 +284,7 @@ def analyze_knowledge(
             primary_author_pct=primary.proportion,
             is_knowledge_island=is_island,
             author_count=n_authors,
-            authors=contributions,
+            authors=tuple(contributions),
         ))
 
     knowledge_files.sort(key=lambda f: f.knowledge_concentration, reverse=True)
@@ -300,7 +300,7 @@ def analyze_knowledge(
         total_commits=total_commits,
         developer_risk_index=gini,
         knowledge_island_count=island_count,
-        files=knowledge_files,
+        files=tuple(knowledge_files),
     )
 
 
@@ -346,7 +346,7 @@ def analyze_coupling(
         return CouplingReport(
             repo_path=repo_path, window_days=window_days,
             from_date=since, to_date=now,
-            total_commits=0, coupling_pairs=[], file_pain=[],
+            total_commits=0, coupling_pairs=(), file_pain=(),
         )
 
     # Build commit → set of files + commit date
@@ -458,7 +458,7 @@ def analyze_coupling(
         repo_path=repo_path, window_days=window_days,
         from_date=since, to_date=now,
         total_commits=total_commits,
-        coupling_pairs=coupling_pairs, file_pain=file_pain,
+        coupling_pairs=tuple(coupling_pairs), file_pain=tuple(file_pain),
     )
 
 
@@ -537,6 +537,7 @@ def compare_hotspots(
         ))
 
     deltas.sort(key=lambda d: abs(d.score_delta), reverse=True)
+    status_counts = Counter(d.status for d in deltas)
 
     return ComparisonReport(
         repo_path=repo_path,
@@ -545,11 +546,11 @@ def compare_hotspots(
         window_days=window_days,
         from_total_commits=from_report.total_commits,
         to_total_commits=to_report.total_commits,
-        files=deltas,
-        new_hotspot_count=sum(1 for d in deltas if d.status == "new"),
-        removed_hotspot_count=sum(1 for d in deltas if d.status == "removed"),
-        improved_count=sum(1 for d in deltas if d.status == "improved"),
-        degraded_count=sum(1 for d in deltas if d.status == "degraded"),
+        files=tuple(deltas),
+        new_hotspot_count=status_counts["new"],
+        removed_hotspot_count=status_counts["removed"],
+        improved_count=status_counts["improved"],
+        degraded_count=status_counts["degraded"],
     )
 
 
@@ -569,7 +570,7 @@ def analyze_anemic(
             total_files=0, total_classes=0,
             anemic_count=0, anemic_percentage=0.0,
             average_ams=0.0, ams_threshold=ams_threshold,
-            files=[],
+            files=(),
         )
 
     file_results: list[FileAnemic] = []
@@ -635,7 +636,7 @@ def analyze_anemic(
         anemic_percentage=pct,
         average_ams=avg_ams,
         ams_threshold=ams_threshold,
-        files=file_results,
+        files=tuple(file_results),
     )
 
 
@@ -657,7 +658,7 @@ def analyze_complexity(
             high_complexity_count=0, complexity_threshold=complexity_threshold,
             avg_length=0.0, max_length=0,
             avg_cognitive=0.0, max_cognitive=0,
-            files=[],
+            files=(),
         )
 
     file_results: list[FileComplexity] = []
@@ -695,7 +696,7 @@ def analyze_complexity(
             high_complexity_count=0, complexity_threshold=complexity_threshold,
             avg_length=0.0, max_length=0,
             avg_cognitive=0.0, max_cognitive=0,
-            files=file_results,
+            files=tuple(file_results),
         )
 
     all_cc = [fn.cyclomatic_complexity for fn in all_funcs]
@@ -722,7 +723,7 @@ def analyze_complexity(
         max_length=max_len,
         avg_cognitive=avg_cog,
         max_cognitive=max_cog,
-        files=file_results,
+        files=tuple(file_results),
     )
 
 
@@ -742,7 +743,7 @@ def analyze_change_clusters(
             repo_path=repo_path, window_days=window_days,
             from_date=since, to_date=now,
             total_commits=0, k=0, silhouette_score=0.0,
-            clusters=[], drift=[],
+            clusters=(), drift=(),
         )
 
     features = extract_commit_features(changes)
@@ -758,13 +759,13 @@ def analyze_change_clusters(
             centroid_file_count=float(cf.file_count),
             centroid_total_churn=float(cf.total_churn),
             centroid_add_ratio=cf.add_ratio,
-            commits=[cf],
+            commits=(cf,),
         )
         return ClusteringReport(
             repo_path=repo_path, window_days=window_days,
             from_date=since, to_date=now,
             total_commits=1, k=1, silhouette_score=0.0,
-            clusters=[cluster], drift=[],
+            clusters=(cluster,), drift=(),
         )
 
     # Build feature matrix
@@ -774,11 +775,12 @@ def analyze_change_clusters(
     ]
     norm_points = min_max_normalize(raw_points)
 
-    # Select k
-    chosen_k = k if k is not None else auto_select_k(norm_points, seed=42)
-
-    # Run k-means
-    centroids, assignments = kmeans(norm_points, k=chosen_k, seed=42)
+    # Select k (auto-selection returns the chosen k's run) or run k-means
+    if k is None:
+        chosen_k, centroids, assignments = auto_select_k(norm_points, seed=42)
+    else:
+        chosen_k = k
+        centroids, assignments = kmeans(norm_points, k=chosen_k, seed=42)
     sil_score = compute_silhouette(norm_points, assignments)
 
     # Normalize centroids for labeling
@@ -805,7 +807,7 @@ def analyze_change_clusters(
             centroid_file_count=centroids[ci][0],
             centroid_total_churn=centroids[ci][1],
             centroid_add_ratio=centroids[ci][2],
-            commits=commits,
+            commits=tuple(commits),
         ))
 
     summaries.sort(key=lambda s: s.size, reverse=True)
@@ -820,8 +822,8 @@ def analyze_change_clusters(
         total_commits=total_commits,
         k=chosen_k,
         silhouette_score=round(sil_score, 4),
-        clusters=summaries,
-        drift=drift,
+        clusters=tuple(summaries),
+        drift=tuple(drift),
     )
 
 
@@ -861,7 +863,7 @@ def analyze_effort(
             total_files=0, model_r_squared=0.0, alpha=chosen_alpha,
             feature_names=FEATURE_NAMES,
             coefficients=[1.0 / n_features] * n_features,
-            files=[],
+            files=(),
         )
 
     # Build feature matrix
@@ -935,7 +937,7 @@ def analyze_effort(
             proxy_label=round(proxy.get(fp, 0.0), 4),
             commit_density=round(density.get(fp, 1.0), 4),
             rework_ratio=round(rework_map.get(fp, 0.0), 4),
-            attributions=attribs,
+            attributions=tuple(attribs),
         ))
 
     # Sort by REI descending
@@ -949,7 +951,7 @@ def analyze_effort(
         alpha=chosen_alpha,
         feature_names=FEATURE_NAMES,
         coefficients=[round(c, 6) for c in coefficients],
-        files=files,
+        files=tuple(files),
     )
 
 
@@ -1012,7 +1014,7 @@ def analyze_dx(
             dx_score=0.0,
             weights=w,
             metrics=metrics,
-            cognitive_load_files=[],
+            cognitive_load_files=(),
         )
 
     # 1. Throughput
@@ -1067,7 +1069,7 @@ def analyze_dx(
         dx_score=round(dx_score, 4),
         weights=w,
         metrics=metrics,
-        cognitive_load_files=cognitive_files,
+        cognitive_load_files=tuple(cognitive_files),
     )
 
 
@@ -1101,7 +1103,7 @@ def analyze_god_classes(
             total_files=0, total_classes=0,
             god_class_count=0, god_class_percentage=0.0,
             average_gcs=0.0, gcs_threshold=gcs_threshold,
-            files=[],
+            files=(),
         )
 
     # Phase 1: Collect raw metrics from all files
@@ -1132,7 +1134,7 @@ def analyze_god_classes(
             total_files=len(raw_file_results), total_classes=0,
             god_class_count=0, god_class_percentage=0.0,
             average_gcs=0.0, gcs_threshold=gcs_threshold,
-            files=raw_file_results,
+            files=tuple(raw_file_results),
         )
 
     # Phase 2: Min-max normalize across all classes
@@ -1176,7 +1178,7 @@ def analyze_god_classes(
             class_count=len(classes),
             god_class_count=god_count,
             worst_gcs=worst,
-            classes=classes,
+            classes=tuple(classes),
         ))
 
     file_results.sort(key=lambda f: f.worst_gcs, reverse=True)
@@ -1197,5 +1199,5 @@ def analyze_god_classes(
         god_class_percentage=pct,
         average_gcs=avg_gcs,
         gcs_threshold=gcs_threshold,
-        files=file_results,
+        files=tuple(file_results),
     )
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RepoSummary:
     repo_path: str
     commit_count: int
@@ -12,7 +12,7 @@ class RepoSummary:
     last_commit_date: datetime | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FileChange:
     """A single file's change within one commit."""
 
@@ -25,7 +25,7 @@ class FileChange:
     author_email: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FileMetrics:
     """Behavioral metrics for a single file within a time window."""
 
@@ -37,7 +37,7 @@ class FileMetrics:
     file_size: int  # current file size in bytes (0 if unknown)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, slots=True)
 class HotspotReport:
     """Behavioral metrics report across all files in a time window."""
 
@@ -46,10 +46,10 @@ class HotspotReport:
     from_date: datetime
     to_date: datetime
     total_commits: int
-    files: list[FileMetrics]  # sorted by hotspot_score descending
+    files: tuple[FileMetrics, ...]  # sorted by hotspot_score descending
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AuthorContribution:
     """A single author's contribution to a file."""
 
@@ -61,7 +61,7 @@ class AuthorContribution:
     weighted_proportion: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FileKnowledge:
     """Knowledge distribution metrics for a single file."""
 
@@ -71,10 +71,10 @@ class FileKnowledge:
     primary_author_pct: float
     is_knowledge_island: bool
     author_count: int
-    authors: list[AuthorContribution]
+    authors: tuple[AuthorContribution, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, slots=True)
 class KnowledgeReport:
     """Knowledge distribution report across all files in a time window."""
 
@@ -85,10 +85,10 @@ class KnowledgeReport:
     total_commits: int
     developer_risk_index: float
     knowledge_island_count: int
-    files: list[FileKnowledge]  # sorted by knowledge_concentration descending
+    files: tuple[FileKnowledge, ...]  # sorted by knowledge_concentration descending
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CouplingPair:
     """Temporal coupling between two files based on co-change frequency."""
 
@@ -102,7 +102,7 @@ class CouplingPair:
     lift: float  # shared / expected_cochange (>1 = stronger than random)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FilePain:
     """PAIN metric for a single file: Size x Distance x Volatility."""
 
@@ -116,7 +116,7 @@ class FilePain:
     pain_score: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, slots=True)
 class CouplingReport:
     """Temporal coupling and PAIN analysis report."""
 
@@ -125,11 +125,11 @@ class CouplingReport:
     from_date: datetime
     to_date: datetime
     total_commits: int
-    coupling_pairs: list[CouplingPair]  # sorted by coupling_strength descending
-    file_pain: list[FilePain]  # sorted by pain_score descending
+    coupling_pairs: tuple[CouplingPair, ...]  # sorted by coupling_strength descending
+    file_pain: tuple[FilePain, ...]  # sorted by pain_score descending
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FileHotspotDelta:
     """Per-file hotspot change between two snapshots."""
 
@@ -146,7 +146,7 @@ class FileHotspotDelta:
     status: str              # "unchanged"|"improved"|"degraded"|"new"|"removed"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, slots=True)
 class ComparisonReport:
     """Hotspot comparison between two points in time."""
 
@@ -158,14 +158,14 @@ class ComparisonReport:
     window_days: int
     from_total_commits: int
     to_total_commits: int
-    files: list[FileHotspotDelta]  # sorted by abs(score_delta) desc
+    files: tuple[FileHotspotDelta, ...]  # sorted by abs(score_delta) desc
     new_hotspot_count: int
     removed_hotspot_count: int
     improved_count: int
     degraded_count: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ClassMetrics:
     """AST-derived metrics for a single class."""
 
@@ -182,7 +182,7 @@ class ClassMetrics:
     ams: float                     # dbsi * orchestration_pressure
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FileAnemic:
     """Anemia metrics for a single file."""
 
@@ -190,11 +190,11 @@ class FileAnemic:
     class_count: int
     anemic_class_count: int
     worst_ams: float               # highest AMS (0.0 if no classes)
-    classes: list[ClassMetrics]    # sorted by ams desc
+    classes: tuple[ClassMetrics, ...]  # sorted by ams desc
     touch_count: int               # other .py files importing from this file
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, slots=True)
 class AnemicReport:
     """Anemia analysis report across all Python files."""
 
@@ -206,10 +206,10 @@ class AnemicReport:
     anemic_percentage: float       # anemic_count / total_classes * 100
     average_ams: float
     ams_threshold: float           # default 0.5
-    files: list[FileAnemic]        # sorted by worst_ams desc
+    files: tuple[FileAnemic, ...]  # sorted by worst_ams desc
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GodClassMetrics:
     """God class metrics for a single class."""
 
@@ -222,7 +222,7 @@ class GodClassMetrics:
     god_class_score: float      # composite GCS [0.0-1.0]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FileGodClass:
     """God class detection results for a single file."""
 
@@ -230,10 +230,10 @@ class FileGodClass:
     class_count: int
     god_class_count: int
     worst_gcs: float            # highest GCS (0.0 if no classes)
-    classes: list[GodClassMetrics]  # sorted by god_class_score desc
+    classes: tuple[GodClassMetrics, ...]  # sorted by god_class_score desc
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, slots=True)
 class GodClassReport:
     """God class detection report across all files."""
 
@@ -245,10 +245,10 @@ class GodClassReport:
     god_class_percentage: float  # god_class_count / total_classes * 100
     average_gcs: float
     gcs_threshold: float         # default 0.6
-    files: list[FileGodClass]    # sorted by worst_gcs desc
+    files: tuple[FileGodClass, ...]  # sorted by worst_gcs desc
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FunctionComplexity:
     """Complexity metrics for a single function or method."""
 
@@ -264,7 +264,7 @@ class FunctionComplexity:
     exception_paths: int           # ast.ExceptHandler count
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FileComplexity:
     """Complexity metrics aggregated for a single file."""
 
@@ -280,10 +280,10 @@ class FileComplexity:
     max_nesting: int
     avg_cognitive: float
     max_cognitive: int
-    functions: list[FunctionComplexity]  # sorted by cyclomatic_complexity desc
+    functions: tuple[FunctionComplexity, ...]  # sorted by cyclomatic_complexity desc
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, slots=True)
 class ComplexityReport:
     """Complexity analysis report across all Python files."""
 
@@ -299,10 +299,10 @@ class ComplexityReport:
     max_length: int
     avg_cognitive: float
     max_cognitive: int
-    files: list[FileComplexity]    # sorted by max_complexity desc
+    files: tuple[FileComplexity, ...]  # sorted by max_complexity desc
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CommitFeatures:
     """Feature vector for a single commit."""
 
@@ -313,7 +313,7 @@ class CommitFeatures:
     add_ratio: float         # lines_added / total_churn (0.0 if churn==0)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ClusterSummary:
     """Summary of a single cluster of commits."""
 
@@ -323,10 +323,10 @@ class ClusterSummary:
     centroid_file_count: float
     centroid_total_churn: float
     centroid_add_ratio: float
-    commits: list[CommitFeatures]
+    commits: tuple[CommitFeatures, ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ClusterDrift:
     """Drift of a cluster between first and second half of window."""
 
@@ -337,7 +337,7 @@ class ClusterDrift:
     trend: str               # "growing"|"shrinking"|"stable"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, slots=True)
 class ClusteringReport:
     """Change clustering analysis report."""
 
@@ -348,11 +348,11 @@ class ClusteringReport:
     total_commits: int
     k: int
     silhouette_score: float
-    clusters: list[ClusterSummary]   # sorted by size desc
-    drift: list[ClusterDrift]        # sorted by abs(drift) desc
+    clusters: tuple[ClusterSummary, ...]  # sorted by size desc
+    drift: tuple[ClusterDrift, ...]  # sorted by abs(drift) desc
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FeatureAttribution:
     """Explains one feature's contribution to a file's REI score."""
 
@@ -362,7 +362,7 @@ class FeatureAttribution:
     contribution: float     # weight * normalized_value
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FileEffort:
     """Effort model results for a single file."""
 
@@ -371,10 +371,10 @@ class FileEffort:
     proxy_label: float      # effort proxy label in [0,1]
     commit_density: float   # 1 / (1 + median_interval_days)
     rework_ratio: float     # from hotspot analysis
-    attributions: list[FeatureAttribution]  # sorted by abs(contribution) desc
+    attributions: tuple[FeatureAttribution, ...]  # sorted by abs(contribution) desc
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, slots=True)
 class EffortReport:
     """Effort modeling report across all files in a time window."""
 
@@ -387,10 +387,10 @@ class EffortReport:
     alpha: float            # ridge regularization parameter
     feature_names: list[str]   # 5 feature names in order
     coefficients: list[float]  # 5 learned coefficients
-    files: list[FileEffort]    # sorted by rei_score desc
+    files: tuple[FileEffort, ...]  # sorted by rei_score desc
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FileCognitiveLoad:
     """Cognitive load breakdown for a single file."""
 
@@ -402,7 +402,7 @@ class FileCognitiveLoad:
     composite_load: float         # mean of 4 sub-scores in [0,1]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DXMetrics:
     """The four DX Core metrics."""
 
@@ -412,7 +412,7 @@ class DXMetrics:
     cognitive_load: float         # [0,1]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False, slots=True)
 class DXReport:
     """Developer Experience analysis report."""
 
@@ -425,4 +425,4 @@ class DXReport:
     dx_score: float               # composite in [0,1]
     weights: list[float]          # 4 weights [throughput, feedback, focus, cognitive]
     metrics: DXMetrics
-    cognitive_load_files: list[FileCognitiveLoad]  # sorted by composite_load desc
+    cognitive_load_files: tuple[FileCognitiveLoad, ...]  # sorted by composite_load desc
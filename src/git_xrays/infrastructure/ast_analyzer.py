@@ -4,10 +4,28 @@ from __future__ import annotations
 
 import ast
 import os
+import re
+from collections import Counter
 
 from git_xrays.domain.models import ClassMetrics, FileAnemic
+from git_xrays.infrastructure.source_cache import SourceResultCache
 
-_LOGIC_NODES = (ast.If, ast.For, ast.While, ast.Try, ast.With)
+# Exact node types, so membership is one hash lookup instead of an isinstance chain.
+_LOGIC_NODES: frozenset[type[ast.AST]] = frozenset(
+    {ast.If, ast.For, ast.While, ast.Try, ast.With}
+)
+
+_ANALYZE_FILE_CACHE: SourceResultCache[FileAnemic] = SourceResultCache(maxsize=256)
+
+# Line-anchored `import a.b as c, d` / `from ..pkg.mod import x` statements,
+# including the space-less relative form `from.pkg import x`. Only used for
+# sources that fail to parse.
+_IMPORT_RE = re.compile(
+    r"^[ \t]*(?:from(?:[ \t]+\.*|\.+)([\w.]*)[ \t]+import\b"
+    r"|import[ \t]+([\w.]+(?:[ \t]+as[ \t]+\w+)?"
+    r"(?:[ \t]*,[ \t]*[\w.]+(?:[ \t]+as[ \t]+\w+)?)*))",
+    re.MULTILINE,
+)
 
 
 def _count_fields(node: ast.ClassDef) -> int:
@@ -57,7 +75,7 @@ def _is_property(func: ast.FunctionDef) -> bool:
 def _has_logic(func: ast.FunctionDef) -> bool:
     """Check if function body contains logic statements (if/for/while/try/with)."""
     for child in ast.walk(func):
-        if isinstance(child, _LOGIC_NODES):
+        if type(child) in _LOGIC_NODES:
             return True
     return False
 
@@ -66,25 +84,31 @@ def analyze_class_source(node: ast.ClassDef, file_path: str) -> ClassMetrics:
     """Analyze a single class AST node and return metrics."""
     field_count = _count_fields(node)
 
-    methods = [n for n in node.body if isinstance(n, ast.FunctionDef)]
-    method_count = len(methods)
-
-    dunder_count = sum(1 for m in methods if _is_dunder(m.name))
-    property_count = sum(1 for m in methods if _is_property(m))
-
-    # Behavior: non-dunder, non-property methods with logic
-    candidate_methods = [
-        m for m in methods
-        if not _is_dunder(m.name) and not _is_property(m)
-    ]
-    behavior_count = sum(1 for m in candidate_methods if _has_logic(m))
+    # Classify each method once: dunder, property, or behavior candidate
+    method_count = dunder_count = property_count = 0
+    n_candidates = behavior_count = 0
+    for m in node.body:
+        if not isinstance(m, ast.FunctionDef):
+            continue
+        method_count += 1
+        if _is_dunder(m.name):
+            dunder_count += 1
+            # A dunder property counts towards both, as before
+            if _is_property(m):
+                property_count += 1
+        elif _is_property(m):
+            property_count += 1
+        else:
+            # Behavior: non-dunder, non-property methods with logic
+            n_candidates += 1
+            if _has_logic(m):
+                behavior_count += 1
 
     # DBSI
     denom = field_count + behavior_count
     dbsi = round(field_count / denom, 4) if denom > 0 else 0.0
 
     # Logic density
-    n_candidates = len(candidate_methods)
     if n_candidates > 0:
         logic_density = round(behavior_count / n_candidates, 4)
     else:
@@ -111,7 +135,27 @@ def analyze_class_source(node: ast.ClassDef, file_path: str) -> ClassMetrics:
 def analyze_file(
     source: str, file_path: str, ams_threshold: float = 0.5,
 ) -> FileAnemic:
-    """Analyze all top-level classes in a Python source string."""
+    """Analyze all top-level classes in a Python source string.
+
+    Results are memoized per (source digest, file_path, ams_threshold) in
+    a bounded cache; the returned FileAnemic is fully immutable, so
+    sharing it is safe. Long-running callers can drop it with
+    clear_analyze_file_cache().
+    """
+    return _ANALYZE_FILE_CACHE.get_or_compute(
+        source, (file_path, ams_threshold),
+        lambda: _analyze_file_uncached(source, file_path, ams_threshold),
+    )
+
+
+def clear_analyze_file_cache() -> None:
+    """Drop all memoized analyze_file results."""
+    _ANALYZE_FILE_CACHE.clear()
+
+
+def _analyze_file_uncached(
+    source: str, file_path: str, ams_threshold: float,
+) -> FileAnemic:
     try:
         tree = ast.parse(source)
     except SyntaxError:
@@ -120,7 +164,7 @@ def analyze_file(
             class_count=0,
             anemic_class_count=0,
             worst_ams=0.0,
-            classes=[],
+            classes=(),
             touch_count=0,
         )
 
@@ -139,16 +183,46 @@ def analyze_file(
         class_count=len(classes),
         anemic_class_count=anemic_count,
         worst_ams=worst_ams,
-        classes=classes,
+        classes=tuple(classes),
         touch_count=0,
     )
 
 
+def _imported_modules(source: str) -> set[str]:
+    """Top-level module names imported by a source.
+
+    Walks the AST's Import/ImportFrom nodes; sources with syntax errors
+    fall back to a line-anchored regex scan.
+    """
+    modules: set[str] = set()
+    if "import" not in source:
+        return modules
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        for from_module, import_list in _IMPORT_RE.findall(source):
+            if import_list:
+                for name in import_list.split(","):
+                    modules.add(name.split()[0].split(".")[0])
+            elif from_module:
+                modules.add(from_module.split(".")[0])
+        return modules
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                modules.add(alias.name.split(".")[0])
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            modules.add(node.module.split(".")[0])
+    return modules
+
+
 def compute_touch_counts(file_sources: dict[str, str]) -> dict[str, int]:
     """Count how many other files import from each file.
 
     Uses heuristic module name matching: strips .py extension and matches
-    against import/from-import module names.
+    against import/from-import module names. Files with syntax errors
+    still contribute their imports through a regex line scan.
     """
     # Build module name → file path mapping
     module_to_file: dict[str, str] = {}
@@ -156,25 +230,14 @@ def compute_touch_counts(file_sources: dict[str, str]) -> dict[str, int]:
         module_name = os.path.splitext(os.path.basename(fp))[0]
         module_to_file[module_name] = fp
 
-    counts: dict[str, int] = {fp: 0 for fp in file_sources}
+    counts: Counter[str] = Counter(dict.fromkeys(file_sources, 0))
 
     for importer_path, source in file_sources.items():
-        try:
-            tree = ast.parse(source)
-        except SyntaxError:
-            continue
-
-        imported_modules: set[str] = set()
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    imported_modules.add(alias.name.split(".")[0])
-            elif isinstance(node, ast.ImportFrom) and node.module:
-                imported_modules.add(node.module.split(".")[0])
-
-        for mod_name in imported_modules:
-            target = module_to_file.get(mod_name)
-            if target and target != importer_path:
-                counts[target] += 1
-
-    return counts
+        targets = {
+            module_to_file[m] for m in _imported_modules(source)
+            if m in module_to_file
+        }
+        targets.discard(importer_path)
+        counts.update(targets)
+
+    return dict(counts)
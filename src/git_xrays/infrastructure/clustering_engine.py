@@ -4,39 +4,49 @@ from __future__ import annotations
 
 import math
 import random
+from array import array
+from bisect import bisect_left
 from collections import defaultdict
+from collections.abc import Iterable, Iterator, Sequence
 from datetime import datetime
+from itertools import accumulate
+from math import dist
 
 from git_xrays.domain.models import ClusterDrift, CommitFeatures, FileChange
 
+# Shrinks Hamerly skip bounds so float rounding can never skip a true tie.
+_BOUND_MARGIN = 1.0 - 1e-9
+
+# Largest sample whose distance triangle auto_select_k keeps (~16 MB of doubles).
+_SHARED_DISTANCE_LIMIT = 2000
+
 
 def extract_commit_features(changes: list[FileChange]) -> list[CommitFeatures]:
     """Group FileChanges by commit_hash and compute per-commit feature vectors."""
     if not changes:
         return []
 
-    commit_data: dict[str, dict] = {}
+    # commit_hash → [date, file paths, lines added, lines deleted]
+    commit_data: dict[str, list] = {}
     for c in changes:
-        if c.commit_hash not in commit_data:
-            commit_data[c.commit_hash] = {
-                "date": c.date,
-                "files": set(),
-                "added": 0,
-                "deleted": 0,
-            }
-        d = commit_data[c.commit_hash]
-        d["files"].add(c.file_path)
-        d["added"] += c.lines_added
-        d["deleted"] += c.lines_deleted
+        d = commit_data.get(c.commit_hash)
+        if d is None:
+            commit_data[c.commit_hash] = [
+                c.date, {c.file_path}, c.lines_added, c.lines_deleted,
+            ]
+        else:
+            d[1].add(c.file_path)
+            d[2] += c.lines_added
+            d[3] += c.lines_deleted
 
     result: list[CommitFeatures] = []
-    for commit_hash, d in commit_data.items():
-        total_churn = d["added"] + d["deleted"]
-        add_ratio = d["added"] / total_churn if total_churn > 0 else 0.0
+    for commit_hash, (date, files, added, deleted) in commit_data.items():
+        total_churn = added + deleted
+        add_ratio = added / total_churn if total_churn > 0 else 0.0
         result.append(CommitFeatures(
             commit_hash=commit_hash,
-            date=d["date"],
-            file_count=len(d["files"]),
+            date=date,
+            file_count=len(files),
             total_churn=total_churn,
             add_ratio=round(add_ratio, 4),
         ))
@@ -49,26 +59,20 @@ def min_max_normalize(data: list[list[float]]) -> list[list[float]]:
     if not data:
         return []
 
-    dims = len(data[0])
-    mins = [min(row[d] for row in data) for d in range(dims)]
-    maxs = [max(row[d] for row in data) for d in range(dims)]
-    ranges = [maxs[d] - mins[d] for d in range(dims)]
-
-    result: list[list[float]] = []
-    for row in data:
-        normalized = []
-        for d in range(dims):
-            if ranges[d] == 0:
-                normalized.append(0.0)
-            else:
-                normalized.append((row[d] - mins[d]) / ranges[d])
-        result.append(normalized)
-
-    return result
+    # Scale column by column (constant dimensions map to 0.0), then
+    # transpose back to rows
+    columns = []
+    for column in zip(*data):
+        lo = min(column)
+        span = max(column) - lo
+        if span == 0:
+            columns.append([0.0] * len(column))
+        else:
+            columns.append([(v - lo) / span for v in column])
 
+    result: list[list[float]] = [list(row) for row in zip(*columns)]
 
-def _euclidean_dist(a: list[float], b: list[float]) -> float:
-    return math.sqrt(sum((ai - bi) ** 2 for ai, bi in zip(a, b)))
+    return result
 
 
 def _kmeans_plus_plus_init(
@@ -84,6 +88,8 @@ def _kmeans_plus_plus_init(
 
     # Pick first centroid uniformly at random
     centroids = [list(points[rng.randrange(n)])]
+    # Distance from each point to its nearest centroid so far
+    closest = [dist(p, centroids[0]) for p in points]
 
     for _ in range(1, k):
         if len(centroids) >= n:
@@ -91,73 +97,148 @@ def _kmeans_plus_plus_init(
             centroids.append(list(centroids[-1]))
             continue
 
-        # Compute D² for each point (distance to nearest existing centroid)
-        d2 = []
-        for p in points:
-            min_dist = min(_euclidean_dist(p, c) for c in centroids)
-            d2.append(min_dist ** 2)
+        # D² for each point (distance to nearest existing centroid)
+        d2 = [c * c for c in closest]
 
         total = sum(d2)
         if total == 0:
             # All points are identical; pick any
-            centroids.append(list(points[rng.randrange(n)]))
-            continue
-
-        # Weighted random selection proportional to D²
-        threshold = rng.random() * total
-        cumulative = 0.0
-        for i, dist_sq in enumerate(d2):
-            cumulative += dist_sq
-            if cumulative >= threshold:
-                centroids.append(list(points[i]))
-                break
+            chosen = rng.randrange(n)
         else:
-            centroids.append(list(points[-1]))
+            # Weighted random selection proportional to D²
+            threshold = rng.random() * total
+            chosen = min(bisect_left(list(accumulate(d2)), threshold), n - 1)
+
+        centroids.append(list(points[chosen]))
+        if len(centroids) == k:
+            break
+        new_centroid = centroids[-1]
+        closest = [
+            min(c, dist(p, new_centroid)) for p, c in zip(points, closest)
+        ]
 
     return centroids
 
 
+def _nearest_two(
+    p: list[float], centroids: list[list[float]],
+) -> tuple[int, float, float]:
+    """Index of the nearest centroid, its distance, and the runner-up distance."""
+    dists = [dist(p, c) for c in centroids]
+    best = dists.index(min(dists))
+    second = min(
+        (d for ci, d in enumerate(dists) if ci != best), default=math.inf,
+    )
+    return best, dists[best], second
+
+
 def kmeans(
     points: list[list[float]], k: int, seed: int = 42, max_iter: int = 100,
+    tol: float = 1e-4,
 ) -> tuple[list[list[float]], list[int]]:
-    """Lloyd's K-Means algorithm with K-Means++ initialization. Returns (centroids, assignments)."""
+    """Lloyd's K-Means algorithm with K-Means++ initialization. Returns (centroids, assignments).
+
+    Uses Hamerly's bounds to skip the full k-distance scan for points that
+    provably keep their centroid. Stops once assignments repeat or the
+    total squared centroid shift falls to ``tol`` times the mean
+    per-dimension variance of the points (scikit-learn's criterion).
+    """
     n = len(points)
     dims = len(points[0])
 
+    # Scale tol by the data's spread so it is independent of units
+    variances = []
+    for column in zip(*points):
+        mean = sum(column) / n
+        variances.append(sum((v - mean) ** 2 for v in column) / n)
+    shift_tol = tol * sum(variances) / dims
+
     rng = random.Random(seed)
     centroids = _kmeans_plus_plus_init(points, k, rng)
 
     assignments = [0] * n
+    # upper[i] >= dist to own centroid; lower[i] <= dist to any other centroid
+    upper = [0.0] * n
+    lower = [0.0] * n
 
     for _ in range(max_iter):
         # Assign each point to nearest centroid
-        new_assignments = []
-        for p in points:
-            dists = [_euclidean_dist(p, c) for c in centroids]
-            new_assignments.append(dists.index(min(dists)))
+        if _ == 0:
+            new_assignments = []
+            for i, p in enumerate(points):
+                best, upper[i], lower[i] = _nearest_two(p, centroids)
+                new_assignments.append(best)
+        else:
+            # Half the gap from each centroid to its closest neighbour
+            half = [
+                0.5 * min(
+                    (dist(c, o) for oi, o in enumerate(centroids) if oi != ci),
+                    default=math.inf,
+                )
+                for ci, c in enumerate(centroids)
+            ]
+            new_assignments = list(assignments)
+            for i, p in enumerate(points):
+                a = assignments[i]
+                # Strict margin keeps near-ties on the exact argmin path
+                bound = max(half[a], lower[i]) * _BOUND_MARGIN
+                if upper[i] < bound:
+                    continue
+                upper[i] = dist(p, centroids[a])
+                if upper[i] < bound:
+                    continue
+                new_assignments[i], upper[i], lower[i] = _nearest_two(p, centroids)
 
         if new_assignments == assignments and _ > 0:
             break
         assignments = new_assignments
 
-        # Recompute centroids
-        for ci in range(k):
-            members = [points[i] for i in range(n) if assignments[i] == ci]
-            if members:
-                centroids[ci] = [
-                    sum(m[d] for m in members) / len(members)
-                    for d in range(dims)
-                ]
+        # Recompute centroids: bucket members in one pass, then sum each
+        # cluster's coordinate columns (zip(*members) transposes to SoA)
+        members: list[list[list[float]]] = [[] for _ in range(k)]
+        for p, ci in zip(points, assignments):
+            members[ci].append(p)
+        shifts = [0.0] * k
+        for ci, group in enumerate(members):
+            if group:
+                size = len(group)
+                moved = [sum(column) / size for column in zip(*group)]
+                shifts[ci] = dist(centroids[ci], moved)
+                centroids[ci] = moved
+
+        # Centroids have effectively stopped moving: label against the
+        # final centroids and stop
+        if sum(sh * sh for sh in shifts) <= shift_tol:
+            assignments = [_nearest_two(p, centroids)[0] for p in points]
+            break
+
+        # Loosen bounds by how far the centroids moved
+        max_shift = max(shifts)
+        for i in range(n):
+            upper[i] += shifts[assignments[i]]
+            lower[i] -= max_shift
 
     return centroids, assignments
 
 
+def _distance_rows(points: list[list[float]]) -> Iterator[list[float]]:
+    """Upper-triangle pairwise distances: row i holds dist(i, j) for j > i."""
+    for i, p in enumerate(points):
+        yield [dist(p, q) for q in points[i + 1:]]
+
+
 def silhouette_score(points: list[list[float]], assignments: list[int]) -> float:
     """Compute mean silhouette coefficient."""
     if not points:
         return 0.0
+    return _silhouette_from_rows(_distance_rows(points), assignments)
 
-    n = len(points)
+
+def _silhouette_from_rows(
+    rows: Iterable[Sequence[float]], assignments: list[int],
+) -> float:
+    """Mean silhouette from upper-triangle distance rows (see _distance_rows)."""
+    n = len(assignments)
     clusters = set(assignments)
     if len(clusters) <= 1:
         return 0.0
@@ -171,33 +252,30 @@ def silhouette_score(points: list[list[float]], assignments: list[int]) -> float
     if all(len(v) == 1 for v in cluster_indices.values()):
         return 0.0
 
+    # sums[i][c]: total distance from point i to the members of cluster c.
+    # Each pair is measured once and credited to both endpoints.
+    slot = {c: idx for idx, c in enumerate(cluster_indices)}
+    labels = [slot[a] for a in assignments]
+    sizes = [len(members) for members in cluster_indices.values()]
+    m = len(sizes)
+    sums = [[0.0] * m for _ in range(n)]
+    for i, distances in enumerate(rows):
+        li = labels[i]
+        row = sums[i]
+        for j, d in enumerate(distances, i + 1):
+            row[labels[j]] += d
+            sums[j][li] += d
+
     scores: list[float] = []
     for i in range(n):
-        own_cluster = assignments[i]
-        own_members = cluster_indices[own_cluster]
+        own = labels[i]
+        row = sums[i]
 
         # a(i): mean distance to same-cluster members
-        if len(own_members) <= 1:
-            a_i = 0.0
-        else:
-            a_i = sum(
-                _euclidean_dist(points[i], points[j])
-                for j in own_members if j != i
-            ) / (len(own_members) - 1)
+        a_i = row[own] / (sizes[own] - 1) if sizes[own] > 1 else 0.0
 
         # b(i): min mean distance to other clusters
-        b_i = float("inf")
-        for c, members in cluster_indices.items():
-            if c == own_cluster:
-                continue
-            mean_dist = sum(
-                _euclidean_dist(points[i], points[j]) for j in members
-            ) / len(members)
-            if mean_dist < b_i:
-                b_i = mean_dist
-
-        if b_i == float("inf"):
-            b_i = 0.0
+        b_i = min(row[c] / sizes[c] for c in range(m) if c != own)
 
         denom = max(a_i, b_i)
         if denom == 0:
@@ -210,23 +288,39 @@ def silhouette_score(points: list[list[float]], assignments: list[int]) -> float
 
 def auto_select_k(
     points: list[list[float]], k_min: int = 2, k_max: int = 8, seed: int = 42,
-) -> int:
-    """Try k=k_min..k_max, return k with highest silhouette score."""
+) -> tuple[int, list[list[float]], list[int]]:
+    """Try k=k_min..k_max and keep the run with the highest silhouette score.
+
+    Returns (k, centroids, assignments) for the chosen k rather than k
+    alone, so callers reuse that run instead of clustering again.
+    """
     n = len(points)
+    if n == 0:
+        return k_min, [], []
     if n <= k_min:
-        return k_min
+        return (k_min, *kmeans(points, k=k_min, seed=seed))
+
+    # Pairwise distances don't depend on k: measure them once for the whole
+    # sweep when the triangle fits comfortably in memory
+    shared_rows = (
+        [array("d", row) for row in _distance_rows(points)]
+        if n <= _SHARED_DISTANCE_LIMIT else None
+    )
 
-    best_k = k_min
+    best: tuple[int, list[list[float]], list[int]] | None = None
     best_score = -2.0
 
     for k in range(k_min, min(k_max, n) + 1):
-        _, assignments = kmeans(points, k=k, seed=seed)
-        score = silhouette_score(points, assignments)
+        centroids, assignments = kmeans(points, k=k, seed=seed)
+        rows = shared_rows if shared_rows is not None else _distance_rows(points)
+        score = _silhouette_from_rows(rows, assignments)
         if score > best_score:
             best_score = score
-            best_k = k
+            best = (k, centroids, assignments)
 
-    return best_k
+    if best is None:
+        return (k_min, *kmeans(points, k=k_min, seed=seed))
+    return best
 
 
 def label_cluster(
@@ -5,36 +5,55 @@ from __future__ import annotations
 import ast
 
 from git_xrays.domain.models import FileComplexity, FunctionComplexity
+from git_xrays.infrastructure.source_cache import SourceResultCache
 
+# Exact node types, matched with type() + set lookup instead of isinstance chains.
+# Decision points besides If/ExceptHandler/BoolOp, which are counted separately.
+_DECISION_NODES: frozenset[type[ast.AST]] = frozenset(
+    {ast.IfExp, ast.For, ast.While, ast.Assert}
+)
+_NESTING_NODES: frozenset[type[ast.AST]] = frozenset(
+    {ast.If, ast.For, ast.While, ast.With, ast.Try}
+)
 
-def _compute_cyclomatic(node: ast.FunctionDef | ast.AsyncFunctionDef) -> int:
-    """Compute cyclomatic complexity: 1 + decision points."""
+_FILE_COMPLEXITY_CACHE: SourceResultCache[FileComplexity] = SourceResultCache(
+    maxsize=256,
+)
+
+
+def _count_decision_points(
+    node: ast.FunctionDef | ast.AsyncFunctionDef,
+) -> tuple[int, int, int]:
+    """Single walk returning (cyclomatic complexity, branch count, exception paths).
+
+    Cyclomatic is 1 + decision points; branches count ast.If nodes (includes
+    elif); exception paths count ast.ExceptHandler nodes.
+    """
     complexity = 1
+    branches = 0
+    handlers = 0
     for child in ast.walk(node):
-        if isinstance(child, (ast.If, ast.IfExp)):
-            complexity += 1
-        elif isinstance(child, ast.For):
+        t = type(child)
+        if t is ast.If:
             complexity += 1
-        elif isinstance(child, ast.While):
+            branches += 1
+        elif t is ast.ExceptHandler:
             complexity += 1
-        elif isinstance(child, ast.ExceptHandler):
+            handlers += 1
+        elif t in _DECISION_NODES:
             complexity += 1
-        elif isinstance(child, ast.Assert):
-            complexity += 1
-        elif isinstance(child, ast.BoolOp):
+        elif t is ast.BoolOp:
             # `a and b and c` = BoolOp(values=[a,b,c]) → adds len(values)-1
             complexity += len(child.values) - 1
-    return complexity
+    return complexity, branches, handlers
 
 
 def _compute_max_nesting(node: ast.FunctionDef | ast.AsyncFunctionDef) -> int:
     """Compute maximum nesting depth of control flow structures."""
-    nesting_types = (ast.If, ast.For, ast.While, ast.With, ast.Try)
-
     def _walk_depth(body: list[ast.stmt], depth: int) -> int:
         max_depth = depth
         for stmt in body:
-            if isinstance(stmt, nesting_types):
+            if type(stmt) in _NESTING_NODES:
                 child_depth = depth + 1
                 if child_depth > max_depth:
                     max_depth = child_depth
@@ -56,24 +75,6 @@ def _compute_max_nesting(node: ast.FunctionDef | ast.AsyncFunctionDef) -> int:
     return _walk_depth(node.body, 0)
 
 
-def _count_branches(node: ast.FunctionDef | ast.AsyncFunctionDef) -> int:
-    """Count number of ast.If nodes (includes elif)."""
-    count = 0
-    for child in ast.walk(node):
-        if isinstance(child, ast.If):
-            count += 1
-    return count
-
-
-def _count_exception_paths(node: ast.FunctionDef | ast.AsyncFunctionDef) -> int:
-    """Count number of ast.ExceptHandler nodes."""
-    count = 0
-    for child in ast.walk(node):
-        if isinstance(child, ast.ExceptHandler):
-            count += 1
-    return count
-
-
 def _compute_cognitive_complexity(node: ast.FunctionDef | ast.AsyncFunctionDef) -> int:
     """Compute cognitive complexity per the SonarSource algorithm.
 
@@ -167,32 +168,58 @@ def _analyze_function_node(
 ) -> FunctionComplexity:
     """Analyze a single function/method AST node."""
     length = (node.end_lineno or node.lineno) - node.lineno + 1
+    cyclomatic, branches, handlers = _count_decision_points(node)
     return FunctionComplexity(
         function_name=node.name,
         file_path=file_path,
         class_name=class_name,
         line_number=node.lineno,
         length=length,
-        cyclomatic_complexity=_compute_cyclomatic(node),
+        cyclomatic_complexity=cyclomatic,
         cognitive_complexity=_compute_cognitive_complexity(node),
         max_nesting_depth=_compute_max_nesting(node),
-        branch_count=_count_branches(node),
-        exception_paths=_count_exception_paths(node),
+        branch_count=branches,
+        exception_paths=handlers,
+    )
+
+
+def _empty_file_complexity(file_path: str) -> FileComplexity:
+    return FileComplexity(
+        file_path=file_path, function_count=0, total_complexity=0,
+        avg_complexity=0.0, max_complexity=0, worst_function="",
+        avg_length=0.0, max_length=0, avg_nesting=0.0, max_nesting=0,
+        avg_cognitive=0.0, max_cognitive=0,
+        functions=(),
     )
 
 
 def analyze_file_complexity(source: str, file_path: str) -> FileComplexity:
-    """Analyze all functions in a Python source file."""
+    """Analyze all functions in a Python source file.
+
+    Results are memoized per (source digest, file_path) in a bounded
+    cache; the returned FileComplexity is fully immutable, so sharing it
+    is safe. Long-running callers can drop it with
+    clear_file_complexity_cache().
+    """
+    # No `def` keyword anywhere means no functions: skip the parse
+    if "def" not in source:
+        return _empty_file_complexity(file_path)
+    return _FILE_COMPLEXITY_CACHE.get_or_compute(
+        source, (file_path,),
+        lambda: _analyze_file_complexity_uncached(source, file_path),
+    )
+
+
+def clear_file_complexity_cache() -> None:
+    """Drop all memoized analyze_file_complexity results."""
+    _FILE_COMPLEXITY_CACHE.clear()
+
+
+def _analyze_file_complexity_uncached(source: str, file_path: str) -> FileComplexity:
     try:
         tree = ast.parse(source)
     except SyntaxError:
-        return FileComplexity(
-            file_path=file_path, function_count=0, total_complexity=0,
-            avg_complexity=0.0, max_complexity=0, worst_function="",
-            avg_length=0.0, max_length=0, avg_nesting=0.0, max_nesting=0,
-            avg_cognitive=0.0, max_cognitive=0,
-            functions=[],
-        )
+        return _empty_file_complexity(file_path)
 
     functions: list[FunctionComplexity] = []
 
@@ -211,13 +238,7 @@ def analyze_file_complexity(source: str, file_path: str) -> FileComplexity:
     functions.sort(key=lambda f: f.cyclomatic_complexity, reverse=True)
 
     if not functions:
-        return FileComplexity(
-            file_path=file_path, function_count=0, total_complexity=0,
-            avg_complexity=0.0, max_complexity=0, worst_function="",
-            avg_length=0.0, max_length=0, avg_nesting=0.0, max_nesting=0,
-            avg_cognitive=0.0, max_cognitive=0,
-            functions=[],
-        )
+        return _empty_file_complexity(file_path)
 
     total_cc = sum(f.cyclomatic_complexity for f in functions)
     max_cc = max(f.cyclomatic_complexity for f in functions)
@@ -244,5 +265,5 @@ def analyze_file_complexity(source: str, file_path: str) -> FileComplexity:
         max_nesting=max_nest,
         avg_cognitive=avg_cog,
         max_cognitive=max_cog,
-        functions=functions,
+        functions=tuple(functions),
     )
@@ -18,9 +18,7 @@ from git_xrays.domain.models import (
     FileMetrics,
     FilePain,
 )
-from git_xrays.infrastructure.effort_engine import (
-    _min_max_normalize as _min_max_norm,
-)
+from git_xrays.infrastructure.effort_engine import _min_max_scale
 
 # Label weights for throughput calculation
 _LABEL_WEIGHTS: dict[str, float] = {
@@ -111,67 +109,50 @@ def compute_cognitive_load_per_file(
 
     Returns list sorted by composite_load descending.
     """
-    # Gather all file paths from all sources
-    all_paths: set[str] = set()
-    for f in hotspot_files:
-        all_paths.add(f.file_path)
-    for f in knowledge_files:
-        all_paths.add(f.file_path)
-    for f in pain_files:
-        all_paths.add(f.file_path)
-    for f in complexity_files:
-        all_paths.add(f.file_path)
-
-    if not all_paths:
+    if not (hotspot_files or knowledge_files or pain_files or complexity_files):
         return []
 
-    # Build lookup maps
-    hot_map = {f.file_path: f for f in hotspot_files}
-    know_map = {f.file_path: f for f in knowledge_files}
-    pain_map = {f.file_path: f for f in pain_files}
-    cx_map = {f.file_path: f for f in complexity_files}
-
-    # Gather raw values for normalization
-    raw_complexity: dict[str, float] = {}
-    raw_coordination: dict[str, float] = {}
-    raw_knowledge: dict[str, float] = {}
-    raw_change_rate: dict[str, float] = {}
-
-    for fp in all_paths:
-        # Complexity: avg_cognitive from ComplexityReport
-        cx = cx_map.get(fp)
-        raw_complexity[fp] = cx.avg_cognitive if cx else 0.0
-
-        # Coordination: distance_normalized from FilePain
-        p = pain_map.get(fp)
-        raw_coordination[fp] = p.distance_normalized if p else 0.0
-
-        # Knowledge: knowledge_concentration from KnowledgeReport
-        k = know_map.get(fp)
-        raw_knowledge[fp] = k.knowledge_concentration if k else 0.0
-
-        # Change rate: change_frequency from hotspot
-        h = hot_map.get(fp)
-        raw_change_rate[fp] = float(h.change_frequency) if h else 0.0
-
-    # Min-max normalize each dimension
-    norm_complexity = _min_max_norm(raw_complexity)
-    norm_coordination = _min_max_norm(raw_coordination)
-    norm_knowledge = _min_max_norm(raw_knowledge)
-    norm_change_rate = _min_max_norm(raw_change_rate)
+    # One file_path -> column index map shared by four parallel columns
+    index: dict[str, int] = {}
+    for files in (hotspot_files, knowledge_files, pain_files, complexity_files):
+        for f in files:
+            if f.file_path not in index:
+                index[f.file_path] = len(index)
+
+    # Raw values, one pass per source; files missing from a source stay 0.0
+    n = len(index)
+    raw_complexity = [0.0] * n
+    raw_coordination = [0.0] * n
+    raw_knowledge = [0.0] * n
+    raw_change_rate = [0.0] * n
+    for cx in complexity_files:
+        raw_complexity[index[cx.file_path]] = cx.avg_cognitive
+    for p in pain_files:
+        raw_coordination[index[p.file_path]] = p.distance_normalized
+    for k in knowledge_files:
+        raw_knowledge[index[k.file_path]] = k.knowledge_concentration
+    for h in hotspot_files:
+        raw_change_rate[index[h.file_path]] = float(h.change_frequency)
+
+    # Min-max normalize each column
+    norm_complexity = _min_max_scale(raw_complexity)
+    norm_coordination = _min_max_scale(raw_coordination)
+    norm_knowledge = _min_max_scale(raw_knowledge)
+    norm_change_rate = _min_max_scale(raw_change_rate)
+
+    w_cs = _COGNITIVE_WEIGHTS["complexity"]
+    w_co = _COGNITIVE_WEIGHTS["coordination"]
+    w_ks = _COGNITIVE_WEIGHTS["knowledge"]
+    w_cr = _COGNITIVE_WEIGHTS["change_rate"]
 
     result: list[FileCognitiveLoad] = []
-    for fp in sorted(all_paths):
-        cs = norm_complexity[fp]
-        co = norm_coordination[fp]
-        ks = norm_knowledge[fp]
-        cr = norm_change_rate[fp]
-        composite = (
-            _COGNITIVE_WEIGHTS["complexity"] * cs
-            + _COGNITIVE_WEIGHTS["coordination"] * co
-            + _COGNITIVE_WEIGHTS["knowledge"] * ks
-            + _COGNITIVE_WEIGHTS["change_rate"] * cr
-        )
+    for fp in sorted(index):
+        i = index[fp]
+        cs = norm_complexity[i]
+        co = norm_coordination[i]
+        ks = norm_knowledge[i]
+        cr = norm_change_rate[i]
+        composite = w_cs * cs + w_co * co + w_ks * ks + w_cr * cr
 
         result.append(FileCognitiveLoad(
             file_path=fp,
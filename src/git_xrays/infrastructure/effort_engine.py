@@ -11,6 +11,7 @@ Functions:
 
 from __future__ import annotations
 
+import operator
 from datetime import datetime
 
 from git_xrays.domain.models import FileKnowledge, FileMetrics, FilePain
@@ -55,6 +56,17 @@ def compute_commit_density(
 # 2. Effort proxy label
 # ---------------------------------------------------------------------------
 
+def _min_max_scale(values: list[float]) -> list[float]:
+    """Min-max scale a list of floats to [0, 1], keeping positions."""
+    if not values:
+        return []
+    lo, hi = min(values), max(values)
+    rng = hi - lo
+    if rng == 0:
+        return [0.0] * len(values)
+    return [(v - lo) / rng for v in values]
+
+
 def _min_max_normalize(values: dict[str, float]) -> dict[str, float]:
     """Min-max normalize a dict of floats to [0, 1]."""
     if not values:
@@ -77,11 +89,16 @@ def compute_effort_proxy(
     """
     if not density:
         return {}
-    norm_d = _min_max_normalize(density)
-    norm_r = _min_max_normalize(rework)
+    norm_d = _min_max_scale(list(density.values()))
+    if rework.keys() == density.keys():
+        # Common case: both inputs cover the same files
+        norm_r = _min_max_scale([rework[fp] for fp in density])
+    else:
+        rework_map = _min_max_normalize(rework)
+        norm_r = [rework_map.get(fp, 0.0) for fp in density]
     return {
-        fp: 0.5 * norm_d.get(fp, 0.0) + 0.5 * norm_r.get(fp, 0.0)
-        for fp in density
+        fp: 0.5 * d + 0.5 * r
+        for fp, d, r in zip(density, norm_d, norm_r)
     }
 
 
@@ -138,44 +155,34 @@ def build_feature_matrix(
 # 4. Ridge regression via Gauss-Jordan elimination
 # ---------------------------------------------------------------------------
 
-def ridge_regression(
+def _normal_equations(
     X: list[list[float]],
     y: list[float],
-    alpha: float = 1.0,
-) -> list[float]:
-    """Solve beta = (X^T X + alpha*I)^{-1} X^T y via Gauss-Jordan.
-
-    Args:
-        X: n x p feature matrix.
-        y: n-length target vector.
-        alpha: regularization strength (>0 guarantees invertibility).
-
-    Returns:
-        p-length coefficient vector.
-    """
-    n = len(X)
+) -> tuple[list[list[float]], list[float]]:
+    """Return (X^T X, X^T y), built column-wise; X^T X is filled symmetrically."""
     p = len(X[0])
-
-    # Compute X^T X + alpha*I  (p x p)
+    cols = list(zip(*X))
     xtx = [[0.0] * p for _ in range(p)]
     for i in range(p):
-        for j in range(p):
-            s = 0.0
-            for k in range(n):
-                s += X[k][i] * X[k][j]
-            xtx[i][j] = s
-        xtx[i][i] += alpha
-
-    # Compute X^T y  (p-length)
-    xty = [0.0] * p
-    for i in range(p):
-        s = 0.0
-        for k in range(n):
-            s += X[k][i] * y[k]
-        xty[i] = s
+        ci = cols[i]
+        for j in range(i, p):
+            xtx[i][j] = xtx[j][i] = sum(map(operator.mul, ci, cols[j]))
+    xty = [sum(map(operator.mul, c, y)) for c in cols]
+    return xtx, xty
+
+
+def _solve_ridge(
+    xtx: list[list[float]],
+    xty: list[float],
+    alpha: float,
+) -> list[float]:
+    """Gauss-Jordan solve of (xtx + alpha*I) beta = xty; inputs are not mutated."""
+    p = len(xty)
 
-    # Gauss-Jordan elimination on augmented matrix [xtx | xty]
+    # Augmented matrix [xtx + alpha*I | xty]
     aug = [xtx[i][:] + [xty[i]] for i in range(p)]
+    for i in range(p):
+        aug[i][i] += alpha
 
     for col in range(p):
         # Partial pivoting
@@ -187,20 +194,41 @@ def ridge_regression(
                 max_row = row
         aug[col], aug[max_row] = aug[max_row], aug[col]
 
-        pivot = aug[col][col]
+        pivot_row = aug[col]
+        pivot = pivot_row[col]
         for j in range(col, p + 1):
-            aug[col][j] /= pivot
+            pivot_row[j] /= pivot
 
         for row in range(p):
             if row == col:
                 continue
-            factor = aug[row][col]
+            target = aug[row]
+            factor = target[col]
             for j in range(col, p + 1):
-                aug[row][j] -= factor * aug[col][j]
+                target[j] -= factor * pivot_row[j]
 
     return [aug[i][p] for i in range(p)]
 
 
+def ridge_regression(
+    X: list[list[float]],
+    y: list[float],
+    alpha: float = 1.0,
+) -> list[float]:
+    """Solve beta = (X^T X + alpha*I)^{-1} X^T y via Gauss-Jordan.
+
+    Args:
+        X: n x p feature matrix.
+        y: n-length target vector.
+        alpha: regularization strength (>0 guarantees invertibility).
+
+    Returns:
+        p-length coefficient vector.
+    """
+    xtx, xty = _normal_equations(X, y)
+    return _solve_ridge(xtx, xty, alpha)
+
+
 # ---------------------------------------------------------------------------
 # 4b. Grid search for alpha
 # ---------------------------------------------------------------------------
@@ -227,15 +255,12 @@ def grid_search_alpha(
     best_alpha = alphas[0]
     best_coeffs: list[float] = []
     best_r2 = -float("inf")
-    p = len(X[0])
-    n = len(X)
+    # X^T X and X^T y do not depend on alpha, so build them once
+    xtx, xty = _normal_equations(X, y)
 
     for alpha in alphas:
-        coeffs = ridge_regression(X, y, alpha=alpha)
-        y_pred = [
-            sum(X[i][j] * coeffs[j] for j in range(p))
-            for i in range(n)
-        ]
+        coeffs = _solve_ridge(xtx, xty, alpha)
+        y_pred = [sum(map(operator.mul, row, coeffs)) for row in X]
         r2_val = r_squared(y, y_pred)
         if r2_val > best_r2:
             best_r2 = r2_val
@@ -256,10 +281,10 @@ def r_squared(y_true: list[float], y_pred: list[float]) -> float:
     """
     n = len(y_true)
     mean_y = sum(y_true) / n
-    ss_tot = sum((yt - mean_y) ** 2 for yt in y_true)
+    ss_tot = sum([(yt - mean_y) * (yt - mean_y) for yt in y_true])
     if ss_tot == 0:
         return 0.0
-    ss_res = sum((yt - yp) ** 2 for yt, yp in zip(y_true, y_pred))
+    ss_res = sum([(yt - yp) * (yt - yp) for yt, yp in zip(y_true, y_pred)])
     return 1.0 - ss_res / ss_tot
 
 
@@ -275,12 +300,5 @@ def compute_rei_scores(
 
     Returns list of REI scores in [0, 1], same order as matrix rows.
     """
-    raw = [
-        sum(row[j] * coefficients[j] for j in range(len(coefficients)))
-        for row in matrix
-    ]
-    lo, hi = min(raw), max(raw)
-    rng = hi - lo
-    if rng == 0:
-        return [0.0] * len(raw)
-    return [(v - lo) / rng for v in raw]
+    raw = [sum(map(operator.mul, row, coefficients)) for row in matrix]
+    return _min_max_scale(raw)
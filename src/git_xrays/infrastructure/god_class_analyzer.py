@@ -7,7 +7,11 @@ from itertools import combinations
 
 from git_xrays.domain.models import FileGodClass, GodClassMetrics
 
-_LOGIC_NODES = (ast.If, ast.For, ast.While, ast.Try, ast.With)
+# Exact node types, matched with type() + set lookup instead of isinstance chains.
+# Each adds one decision point; BoolOp adds len(values) - 1.
+_DECISION_NODES: frozenset[type[ast.AST]] = frozenset(
+    {ast.If, ast.IfExp, ast.For, ast.While, ast.ExceptHandler, ast.Assert}
+)
 
 
 def _count_fields(node: ast.ClassDef) -> int:
@@ -46,70 +50,54 @@ def _is_property(func: ast.FunctionDef) -> bool:
     )
 
 
-def _get_candidate_methods(node: ast.ClassDef) -> list[ast.FunctionDef]:
-    """Return non-dunder, non-property methods."""
-    return [
-        m for m in node.body
-        if isinstance(m, ast.FunctionDef)
-        and not _is_dunder(m.name)
-        and not _is_property(m)
-    ]
+def _is_candidate(func: ast.FunctionDef) -> bool:
+    """Candidate methods for TCC: non-dunder, non-property."""
+    return not _is_dunder(func.name) and not _is_property(func)
 
 
-def _compute_method_complexity(func: ast.FunctionDef) -> int:
-    """Compute cyclomatic complexity for a single method."""
+def _scan_method(func: ast.FunctionDef) -> tuple[int, set[str]]:
+    """Cyclomatic complexity and self.x field accesses, in one walk."""
     complexity = 1
+    fields: set[str] = set()
     for child in ast.walk(func):
-        if isinstance(child, (ast.If, ast.IfExp)):
-            complexity += 1
-        elif isinstance(child, ast.For):
-            complexity += 1
-        elif isinstance(child, ast.While):
-            complexity += 1
-        elif isinstance(child, ast.ExceptHandler):
+        t = type(child)
+        if t in _DECISION_NODES:
             complexity += 1
-        elif isinstance(child, ast.Assert):
-            complexity += 1
-        elif isinstance(child, ast.BoolOp):
+        elif t is ast.BoolOp:
             complexity += len(child.values) - 1
-    return complexity
-
-
-def _compute_wmc(node: ast.ClassDef) -> int:
-    """Weighted Methods per Class: sum of cyclomatic complexity of all methods."""
-    methods = [m for m in node.body if isinstance(m, ast.FunctionDef)]
-    return sum(_compute_method_complexity(m) for m in methods)
-
-
-def _get_field_accesses(func: ast.FunctionDef) -> set[str]:
-    """Collect set of self.x field accesses in a method."""
-    fields: set[str] = set()
-    for child in ast.walk(func):
-        if (
-            isinstance(child, ast.Attribute)
-            and isinstance(child.value, ast.Name)
+        elif (
+            t is ast.Attribute
+            and type(child.value) is ast.Name
             and child.value.id == "self"
         ):
             fields.add(child.attr)
-    return fields
+    return complexity, fields
 
 
-def _compute_tcc(node: ast.ClassDef) -> float:
-    """Tight Class Cohesion: fraction of method pairs sharing field access.
+def _tcc_from_fields(method_fields: list[set[str]]) -> float:
+    """Tight Class Cohesion: fraction of candidate method pairs sharing field access.
 
-    TCC = connected_pairs / total_possible_pairs.
-    Returns 1.0 if <= 1 candidate method (maximally cohesive by convention).
+    TCC = connected_pairs / total_possible_pairs, from each candidate's
+    set of self.x accesses. Returns 1.0 if <= 1 candidate method
+    (maximally cohesive by convention).
     """
-    candidates = _get_candidate_methods(node)
-    if len(candidates) <= 1:
+    if len(method_fields) <= 1:
         return 1.0
 
-    method_fields = [_get_field_accesses(m) for m in candidates]
-    total_pairs = len(candidates) * (len(candidates) - 1) // 2
-    connected = sum(
-        1 for a, b in combinations(range(len(candidates)), 2)
-        if method_fields[a] & method_fields[b]
-    )
+    # One bit per distinct field, so a pair test is a single int AND
+    field_bits: dict[str, int] = {}
+    masks: list[int] = []
+    for names in method_fields:
+        mask = 0
+        for name in names:
+            bit = field_bits.get(name)
+            if bit is None:
+                bit = field_bits[name] = 1 << len(field_bits)
+            mask |= bit
+        masks.append(mask)
+
+    total_pairs = len(masks) * (len(masks) - 1) // 2
+    connected = sum(1 for a, b in combinations(masks, 2) if a & b)
     return round(connected / total_pairs, 4) if total_pairs > 0 else 1.0
 
 
@@ -119,10 +107,20 @@ def _analyze_python_class(node: ast.ClassDef, file_path: str) -> GodClassMetrics
     Returns raw metrics with god_class_score=0.0 (normalization happens in use case).
     """
     field_count = _count_fields(node)
-    candidate_methods = _get_candidate_methods(node)
-    method_count = len(candidate_methods)
-    total_complexity = _compute_wmc(node)
-    cohesion = _compute_tcc(node)
+
+    # Walk each method once for both its complexity (WMC over all
+    # methods) and its field accesses (TCC over candidates only)
+    total_complexity = 0
+    candidate_fields: list[set[str]] = []
+    for m in node.body:
+        if not isinstance(m, ast.FunctionDef):
+            continue
+        complexity, fields = _scan_method(m)
+        total_complexity += complexity
+        if _is_candidate(m):
+            candidate_fields.append(fields)
+    method_count = len(candidate_fields)
+    cohesion = _tcc_from_fields(candidate_fields)
 
     return GodClassMetrics(
         class_name=node.name,
@@ -142,7 +140,7 @@ def analyze_python_god_classes(source: str, file_path: str) -> FileGodClass:
     except SyntaxError:
         return FileGodClass(
             file_path=file_path, class_count=0,
-            god_class_count=0, worst_gcs=0.0, classes=[],
+            god_class_count=0, worst_gcs=0.0, classes=(),
         )
 
     classes: list[GodClassMetrics] = []
@@ -155,5 +153,5 @@ def analyze_python_god_classes(source: str, file_path: str) -> FileGodClass:
         class_count=len(classes),
         god_class_count=0,
         worst_gcs=0.0,
-        classes=classes,
+        classes=tuple(classes),
     )
@@ -18,8 +18,21 @@ _LOGIC_TYPES = frozenset({
     "enhanced_for_statement",
 })
 
+_CLASS_TYPES = frozenset({"class_declaration", "record_declaration"})
+
 _GETTER_SETTER_RE = re.compile(r"^(get|set|is)[A-Z]")
 
+# Line-anchored `import a.b.C;` / `import static a.b.C.m;` statements.
+# Wildcard imports (`a.b.*`) name no class and are skipped.
+_IMPORT_RE = re.compile(
+    r"^[ \t]*import[ \t]+(?:static[ \t]+)?([\w.]+)[ \t]*;",
+    re.MULTILINE,
+)
+
+# Block comments and text blocks, blanked before the import scan so that
+# `import` lines inside them are not counted.
+_BLOCK_RE = re.compile(r'/\*.*?\*/|""".*?"""', re.DOTALL)
+
 
 def _count_fields(class_node: Node) -> int:
     """Count field declarations in a class/record body."""
@@ -151,10 +164,9 @@ def analyze_java_file_anemic(
     if root.has_error:
         return FileAnemic(
             file_path=file_path, class_count=0, anemic_class_count=0,
-            worst_ams=0.0, classes=[], touch_count=0,
+            worst_ams=0.0, classes=(), touch_count=0,
         )
 
-    _CLASS_TYPES = ("class_declaration", "record_declaration")
     classes: list[ClassMetrics] = []
 
     for top_node in root.named_children:
@@ -173,16 +185,24 @@ def analyze_java_file_anemic(
         class_count=len(classes),
         anemic_class_count=anemic_count,
         worst_ams=worst_ams,
-        classes=classes,
+        classes=tuple(classes),
         touch_count=0,
     )
 
 
+def _imported_classes(source: str) -> set[str]:
+    """Simple class names imported by a source, via a regex line scan."""
+    if "/*" in source or '"""' in source:
+        source = _BLOCK_RE.sub("", source)
+    return {path.rpartition(".")[2] for path in _IMPORT_RE.findall(source)}
+
+
 def compute_java_touch_counts(file_sources: dict[str, str]) -> dict[str, int]:
     """Count how many other Java files import from each file.
 
     Uses heuristic: extracts class name from filename, matches against
-    import statements in other files.
+    import statements in other files. Imports are found with a
+    line-anchored regex scan rather than a full parse.
     """
     # Build simple class name → file path mapping
     class_to_file: dict[str, str] = {}
@@ -192,27 +212,8 @@ def compute_java_touch_counts(file_sources: dict[str, str]) -> dict[str, int]:
 
     counts: dict[str, int] = {fp: 0 for fp in file_sources}
 
-    parser = Parser(JAVA_LANGUAGE)
-
     for importer_path, source in file_sources.items():
-        tree = parser.parse(source.encode("utf-8"))
-        root = tree.root_node
-
-        imported_classes: set[str] = set()
-        for node in root.named_children:
-            if node.type == "import_declaration":
-                # Extract the imported class name (last segment)
-                text = node.text.decode("utf-8")
-                # Remove "import " prefix and ";" suffix
-                import_path = text.replace("import ", "").replace(";", "").strip()
-                # Remove "static " if present
-                import_path = import_path.replace("static ", "")
-                # Get last segment (class name)
-                parts = import_path.split(".")
-                if parts:
-                    imported_classes.add(parts[-1])
-
-        for cls_name in imported_classes:
+        for cls_name in _imported_classes(source):
             target = class_to_file.get(cls_name)
             if target and target != importer_path:
                 counts[target] += 1
@@ -195,7 +195,7 @@ def analyze_java_file_complexity(source: str, file_path: str) -> FileComplexity:
             avg_complexity=0.0, max_complexity=0, worst_function="",
             avg_length=0.0, max_length=0, avg_nesting=0.0, max_nesting=0,
             avg_cognitive=0.0, max_cognitive=0,
-            functions=[],
+            functions=(),
         )
 
     functions: list[FunctionComplexity] = []
@@ -252,7 +252,7 @@ def analyze_java_file_complexity(source: str, file_path: str) -> FileComplexity:
             avg_complexity=0.0, max_complexity=0, worst_function="",
             avg_length=0.0, max_length=0, avg_nesting=0.0, max_nesting=0,
             avg_cognitive=0.0, max_cognitive=0,
-            functions=[],
+            functions=(),
         )
 
     total_cc = sum(f.cyclomatic_complexity for f in functions)
@@ -280,5 +280,5 @@ def analyze_java_file_complexity(source: str, file_path: str) -> FileComplexity:
         max_nesting=max_nest,
         avg_cognitive=avg_cog,
         max_cognitive=max_cog,
-        functions=functions,
+        functions=tuple(functions),
     )
@@ -20,6 +20,12 @@ _DECISION_TYPES = frozenset({
     "ternary_expression",
 })
 
+_LOGIC_TYPES = frozenset({
+    "if_statement", "for_statement", "while_statement",
+    "do_statement", "try_statement", "switch_expression",
+    "enhanced_for_statement",
+})
+
 _CLASS_TYPES = frozenset({"class_declaration", "record_declaration"})
 
 
@@ -60,15 +66,10 @@ def _is_getter_or_setter(method_node: Node) -> bool:
 
 def _has_logic(node: Node) -> bool:
     """Check if a node contains logic statements (iterative)."""
-    logic_types = frozenset({
-        "if_statement", "for_statement", "while_statement",
-        "do_statement", "try_statement", "switch_expression",
-        "enhanced_for_statement",
-    })
     stack = [node]
     while stack:
         n = stack.pop()
-        if n.type in logic_types:
+        if n.type in _LOGIC_TYPES:
             return True
         stack.extend(n.children)
     return False
@@ -188,7 +189,7 @@ def analyze_java_god_classes(source: str, file_path: str) -> FileGodClass:
     if root.has_error:
         return FileGodClass(
             file_path=file_path, class_count=0,
-            god_class_count=0, worst_gcs=0.0, classes=[],
+            god_class_count=0, worst_gcs=0.0, classes=(),
         )
 
     classes: list[GodClassMetrics] = []
@@ -201,5 +202,5 @@ def analyze_java_god_classes(source: str, file_path: str) -> FileGodClass:
         class_count=len(classes),
         god_class_count=0,
         worst_gcs=0.0,
-        classes=classes,
+        classes=tuple(classes),
     )
@@ -0,0 +1,53 @@
+"""Bounded per-source result cache keyed on a digest of the source text."""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class SourceResultCache(Generic[T]):
+    """LRU cache of analysis results for source files.
+
+    Keys are a 16-byte BLAKE2b digest of the source plus any extra
+    hashable arguments, so the cache never keeps the source text itself
+    alive. Cached results must be immutable, since every hit shares them.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple[Hashable, ...], T] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_compute(
+        self, source: str, extra: tuple[Hashable, ...], compute: Callable[[], T],
+    ) -> T:
+        key = (
+            hashlib.blake2b(source.encode("utf-8"), digest_size=16).digest(),
+            *extra,
+        )
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+        result = compute()
+
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return result
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -122,7 +122,7 @@ class TestAnalyzeHotspots:
     def test_empty_changes(self):
         repo = FakeGitRepository(file_changes_val=[])
         report = analyze_hotspots(repo, "/repo", 90, current_time=NOW)
-        assert report.files == []
+        assert report.files == ()
         assert report.total_commits == 0
 
     def test_window_filtering(self):
@@ -341,7 +341,7 @@ class TestAnalyzeKnowledge:
     def test_empty_changes_returns_empty_report(self):
         repo = FakeGitRepository(file_changes_val=[])
         report = analyze_knowledge(repo, "/repo", 90, current_time=NOW)
-        assert report.files == []
+        assert report.files == ()
         assert report.total_commits == 0
         assert report.developer_risk_index == 0.0
         assert report.knowledge_island_count == 0
@@ -797,7 +797,7 @@ class TestPainMetric:
     def test_empty_changes_no_pain(self):
         repo = FakeGitRepository(file_changes_val=[])
         report = analyze_coupling(repo, "/repo", 90, current_time=NOW)
-        assert report.file_pain == []
+        assert report.file_pain == ()
 
     # Step 6: Distance dimension
     def test_distance_is_mean_coupling_strength(self):
@@ -1153,7 +1153,7 @@ class TestCompareHotspots:
             ref_dates={"from": from_date, "to": to_date},
         )
         report = compare_hotspots(repo, "/repo", 90, "from", "to")
-        assert report.files == []
+        assert report.files == ()
 
     # Step 4: Sorting and counts
 
@@ -1343,7 +1343,7 @@ class TestAnalyzeAnemic:
         assert report.total_files == 0
         assert report.total_classes == 0
         assert report.anemic_count == 0
-        assert report.files == []
+        assert report.files == ()
 
     def test_single_anemic_class_detected(self):
         source = (
@@ -1506,7 +1506,7 @@ class TestAnalyzeComplexity:
         report = analyze_complexity(reader, "/repo")
         assert report.total_files == 0
         assert report.total_functions == 0
-        assert report.files == []
+        assert report.files == ()
 
     def test_single_file_single_function(self):
         source = "def process(x):\n    if x > 0:\n        return x\n    return 0\n"
@@ -1627,8 +1627,8 @@ class TestAnalyzeChangeClusters:
         report = analyze_change_clusters(repo, "/repo", 90, current_time=NOW)
         assert report.total_commits == 0
         assert report.k == 0
-        assert report.clusters == []
-        assert report.drift == []
+        assert report.clusters == ()
+        assert report.drift == ()
 
     def test_single_commit_returns_single_cluster(self):
         changes = [_make_change("a.py", "c1", days_ago=5, added=10, deleted=5)]
@@ -1687,7 +1687,7 @@ class TestAnalyzeEffort:
         report = analyze_effort(repo, "/repo", 90, current_time=NOW)
         assert report.total_files == 0
         assert report.model_r_squared == 0.0
-        assert report.files == []
+        assert report.files == ()
 
     def test_single_file_uses_fallback(self):
         changes = [_make_change("a.py", "c1", days_ago=5)]
@@ -2028,7 +2028,7 @@ class TestAnalyzeGodClasses:
         report = analyze_god_classes(reader, "/repo")
         assert report.total_classes == 0
         assert report.god_class_count == 0
-        assert report.files == []
+        assert report.files == ()
 
     def test_python_only(self):
         reader = FakeSourceCodeReader({
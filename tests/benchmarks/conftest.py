@@ -0,0 +1,22 @@
+import pytest
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item],
+) -> None:
+    """Deselect benchmarks unless the -m expression asks for them.
+
+    A plain -m default in addopts would be replaced by any -m given on the
+    command line (e.g. `-m 'not slow'`), so the default lives here instead.
+    """
+    if "benchmark" in config.getoption("markexpr", ""):
+        return
+    selected, deselected = [], []
+    for item in items:
+        if item.get_closest_marker("benchmark") is None:
+            selected.append(item)
+        else:
+            deselected.append(item)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
@@ -0,0 +1,50 @@
+"""Construction-cost benchmarks for the hot-path domain models.
+
+Deselected by default; run with ``pytest -m benchmark tests/benchmarks``.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from git_xrays.domain.models import CouplingPair, FileChange, FileMetrics
+
+N = 10_000
+DT = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+pytestmark = pytest.mark.benchmark(group="construction")
+
+
+class TestModelConstruction:
+    def test_file_change(self, benchmark):
+        result = benchmark(lambda: [
+            FileChange(
+                commit_hash="h", date=DT, file_path="p.py",
+                lines_added=1, lines_deleted=0,
+                author_name="A", author_email="a@x",
+            )
+            for _ in range(N)
+        ])
+        assert len(result) == N
+
+    def test_coupling_pair(self, benchmark):
+        result = benchmark(lambda: [
+            CouplingPair(
+                file_a="a.py", file_b="b.py",
+                shared_commits=1, total_commits=5,
+                coupling_strength=0.5, support=0.2,
+                expected_cochange=1.0, lift=1.0,
+            )
+            for _ in range(N)
+        ])
+        assert len(result) == N
+
+    def test_file_metrics(self, benchmark):
+        result = benchmark(lambda: [
+            FileMetrics(
+                file_path="a.py", change_frequency=1, code_churn=10,
+                hotspot_score=1.0, rework_ratio=0.0, file_size=0,
+            )
+            for _ in range(N)
+        ])
+        assert len(result) == N
@@ -1,27 +1,57 @@
 import os
 import subprocess
+from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import pytest
 
 
-@pytest.fixture
-def tmp_git_repo(tmp_path: Path) -> Path:
-    """Create a temporary git repository."""
+@pytest.fixture(scope="session")
+def empty_git_template(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """An empty template dir so `git init` skips copying hooks and info/."""
+    return tmp_path_factory.mktemp("empty_git_template")
+
+
+def init_git_repo(path: Path, template: Path) -> Path:
+    """Run `git init` in path and set a fixed committer identity."""
     subprocess.run(
-        ["git", "init", str(tmp_path)],
+        [
+            "git", "init", "-q",
+            f"--template={template}",
+            "--initial-branch=main",
+            str(path),
+        ],
         capture_output=True, check=True,
     )
     subprocess.run(
-        ["git", "-C", str(tmp_path), "config", "user.name", "Test User"],
+        ["git", "-C", str(path), "config", "user.name", "Test User"],
         capture_output=True, check=True,
     )
     subprocess.run(
-        ["git", "-C", str(tmp_path), "config", "user.email", "test@example.com"],
+        ["git", "-C", str(path), "config", "user.email", "test@example.com"],
         capture_output=True, check=True,
     )
-    return tmp_path
+    return path
+
+
+@pytest.fixture
+def tmp_git_repo(tmp_path: Path, empty_git_template: Path) -> Path:
+    """Create a temporary git repository."""
+    return init_git_repo(tmp_path, empty_git_template)
+
+
+@pytest.fixture(scope="session")
+def shared_git_repo(
+    tmp_path_factory: pytest.TempPathFactory, empty_git_template: Path,
+) -> Callable[[str], Path]:
+    """Factory for session-wide repos; callers must treat them as read-only."""
+
+    def make(name: str) -> Path:
+        return init_git_repo(tmp_path_factory.mktemp(name), empty_git_template)
+
+    return make
 
 
 def commit_file(
@@ -61,55 +91,85 @@ def commit_file(
     )
 
 
-@pytest.fixture
-def git_repo_with_history(tmp_git_repo: Path) -> Path:
+@pytest.fixture(scope="session")
+def git_repo_with_history(shared_git_repo: Callable[[str], Path]) -> Path:
     """Create a repo with 5 commits across 3 files over 60 days."""
-    commit_file(tmp_git_repo, "README.md", "# Project\n", "Initial commit", days_ago=60)
-    commit_file(tmp_git_repo, "src/main.py", "print('hello')\n", "Add main", days_ago=45)
-    commit_file(tmp_git_repo, "src/utils.py", "def helper(): pass\n", "Add utils", days_ago=30)
-    commit_file(tmp_git_repo, "src/main.py", "print('hello world')\n", "Update main", days_ago=15)
-    commit_file(tmp_git_repo, "README.md", "# Project\nUpdated.\n", "Update README", days_ago=5)
-    return tmp_git_repo
+    repo = shared_git_repo("git_repo_with_history")
+    commit_file(repo, "README.md", "# Project\n", "Initial commit", days_ago=60)
+    commit_file(repo, "src/main.py", "print('hello')\n", "Add main", days_ago=45)
+    commit_file(repo, "src/utils.py", "def helper(): pass\n", "Add utils", days_ago=30)
+    commit_file(repo, "src/main.py", "print('hello world')\n", "Update main", days_ago=15)
+    commit_file(repo, "README.md", "# Project\nUpdated.\n", "Update README", days_ago=5)
+    return repo
+
+
+@dataclass(frozen=True, slots=True)
+class RepoHead:
+    """HEAD of a fixture repo, resolved once so tests need not shell out."""
+
+    sha: str
+    short_sha: str
+    branch: str
+    date: datetime  # author date, as GitCliReader reports it
+
+
+@pytest.fixture(scope="session")
+def history_head(git_repo_with_history: Path) -> RepoHead:
+    """HEAD commit hashes, branch name and author date of git_repo_with_history."""
+    log = subprocess.run(
+        ["git", "-C", str(git_repo_with_history), "log", "-1", "--format=%H %h %aI"],
+        capture_output=True, text=True, check=True,
+    )
+    branch = subprocess.run(
+        ["git", "-C", str(git_repo_with_history), "branch", "--show-current"],
+        capture_output=True, text=True, check=True,
+    )
+    sha, short_sha, date = log.stdout.split()
+    return RepoHead(
+        sha=sha, short_sha=short_sha, branch=branch.stdout.strip(),
+        date=datetime.fromisoformat(date),
+    )
 
 
-@pytest.fixture
-def multi_author_repo(tmp_git_repo: Path) -> Path:
+@pytest.fixture(scope="session")
+def multi_author_repo(shared_git_repo: Callable[[str], Path]) -> Path:
     """Create a repo with 3 authors, 3 files, 9 commits.
 
     Alice: dominates main.py (3 commits), 1 utils.py commit
     Bob:   1 main.py commit, dominates config.py (2 commits)
     Carol: 1 utils.py commit, 1 config.py commit
     """
+    repo = shared_git_repo("multi_author_repo")
     # Alice creates main.py (commit 1)
-    commit_file(tmp_git_repo, "main.py", "print('v1')\n", "Alice: create main",
+    commit_file(repo, "main.py", "print('v1')\n", "Alice: create main",
                 days_ago=30, author_name="Alice", author_email="alice@example.com")
     # Alice updates main.py (commit 2)
-    commit_file(tmp_git_repo, "main.py", "print('v2')\n", "Alice: update main",
+    commit_file(repo, "main.py", "print('v2')\n", "Alice: update main",
                 days_ago=25, author_name="Alice", author_email="alice@example.com")
     # Alice updates main.py again (commit 3)
-    commit_file(tmp_git_repo, "main.py", "print('v3')\n", "Alice: update main again",
+    commit_file(repo, "main.py", "print('v3')\n", "Alice: update main again",
                 days_ago=20, author_name="Alice", author_email="alice@example.com")
     # Bob touches main.py (commit 4)
-    commit_file(tmp_git_repo, "main.py", "print('v4')\n", "Bob: touch main",
+    commit_file(repo, "main.py", "print('v4')\n", "Bob: touch main",
                 days_ago=18, author_name="Bob", author_email="bob@example.com")
     # Alice adds utils.py (commit 5)
-    commit_file(tmp_git_repo, "utils.py", "def util(): pass\n", "Alice: add utils",
+    commit_file(repo, "utils.py", "def util(): pass\n", "Alice: add utils",
                 days_ago=15, author_name="Alice", author_email="alice@example.com")
     # Carol adds to utils.py (commit 6)
-    commit_file(tmp_git_repo, "utils.py", "def util(): pass\ndef other(): pass\n",
+    commit_file(repo, "utils.py", "def util(): pass\ndef other(): pass\n",
                 "Carol: add to utils", days_ago=12,
                 author_name="Carol", author_email="carol@example.com")
     # Bob creates config.py (commit 7)
-    commit_file(tmp_git_repo, "config.py", "DEBUG=True\n", "Bob: create config",
+    commit_file(repo, "config.py", "DEBUG=True\n", "Bob: create config",
                 days_ago=10, author_name="Bob", author_email="bob@example.com")
     # Bob updates config.py (commit 8)
-    commit_file(tmp_git_repo, "config.py", "DEBUG=False\n", "Bob: update config",
+    commit_file(repo, "config.py", "DEBUG=False\n", "Bob: update config",
                 days_ago=5, author_name="Bob", author_email="bob@example.com")
     # Carol touches config.py (commit 9)
-    commit_file(tmp_git_repo, "config.py", "DEBUG=False\nVERBOSE=True\n",
+    commit_file(repo, "config.py", "DEBUG=False\nVERBOSE=True\n",
                 "Carol: touch config", days_ago=2,
                 author_name="Carol", author_email="carol@example.com")
-    return tmp_git_repo
+    return repo
 
 
 def commit_files(
@@ -129,11 +189,10 @@ def commit_files(
     date = datetime.now(timezone.utc) - timedelta(days=days_ago)
     date_str = date.strftime("%Y-%m-%dT%H:%M:%S %z")
 
-    for file_path in files:
-        subprocess.run(
-            ["git", "-C", str(repo), "add", file_path],
-            capture_output=True, check=True,
-        )
+    subprocess.run(
+        ["git", "-C", str(repo), "add", "--", *files],
+        capture_output=True, check=True,
+    )
 
     env = {
         **os.environ,
@@ -159,8 +218,8 @@ def create_tag(repo: Path, tag_name: str) -> None:
     )
 
 
-@pytest.fixture
-def tagged_repo(tmp_git_repo: Path) -> Path:
+@pytest.fixture(scope="session")
+def tagged_repo(shared_git_repo: Callable[[str], Path]) -> Path:
     """Create a repo with tags for time-travel testing.
 
     Timeline:
@@ -170,26 +229,28 @@ def tagged_repo(tmp_git_repo: Path) -> Path:
     - 20 days ago: add utils.py
     - 10 days ago: update main.py → tag v2.0
     """
-    commit_file(tmp_git_repo, "README.md", "# Project\n", "Init README", days_ago=60)
-    commit_file(tmp_git_repo, "src/main.py", "print('v1')\n", "Add main", days_ago=50)
-    create_tag(tmp_git_repo, "v1.0")
-    commit_file(tmp_git_repo, "src/main.py", "print('v2')\n", "Update main", days_ago=30)
-    commit_file(tmp_git_repo, "src/utils.py", "def helper(): pass\n", "Add utils", days_ago=20)
-    commit_file(tmp_git_repo, "src/main.py", "print('v3')\n", "Update main again", days_ago=10)
-    create_tag(tmp_git_repo, "v2.0")
-    return tmp_git_repo
-
-
-@pytest.fixture
-def anemic_repo(tmp_git_repo: Path) -> Path:
+    repo = shared_git_repo("tagged_repo")
+    commit_file(repo, "README.md", "# Project\n", "Init README", days_ago=60)
+    commit_file(repo, "src/main.py", "print('v1')\n", "Add main", days_ago=50)
+    create_tag(repo, "v1.0")
+    commit_file(repo, "src/main.py", "print('v2')\n", "Update main", days_ago=30)
+    commit_file(repo, "src/utils.py", "def helper(): pass\n", "Add utils", days_ago=20)
+    commit_file(repo, "src/main.py", "print('v3')\n", "Update main again", days_ago=10)
+    create_tag(repo, "v2.0")
+    return repo
+
+
+@pytest.fixture(scope="session")
+def anemic_repo(shared_git_repo: Callable[[str], Path]) -> Path:
     """Create a repo with a mix of anemic and healthy Python classes.
 
     - models.py: UserDTO (anemic - data only + getters)
     - services.py: UserService (healthy - logic methods)
     - README.md: non-Python file (should be excluded)
     """
+    repo = shared_git_repo("anemic_repo")
     commit_file(
-        tmp_git_repo, "models.py",
+        repo, "models.py",
         (
             "class UserDTO:\n"
             "    name = ''\n"
@@ -204,7 +265,7 @@ def anemic_repo(tmp_git_repo: Path) -> Path:
         days_ago=10,
     )
     commit_file(
-        tmp_git_repo, "services.py",
+        repo, "services.py",
         (
             "import models\n"
             "\n"
@@ -220,12 +281,12 @@ def anemic_repo(tmp_git_repo: Path) -> Path:
         days_ago=5,
     )
     commit_file(
-        tmp_git_repo, "README.md",
+        repo, "README.md",
         "# Project\n",
         "Add readme",
         days_ago=3,
     )
-    return tmp_git_repo
+    return repo
 
 
 @pytest.fixture
@@ -460,44 +521,45 @@ def dx_repo(tmp_git_repo: Path) -> Path:
     return tmp_git_repo
 
 
-@pytest.fixture
-def coupled_repo(tmp_git_repo: Path) -> Path:
+@pytest.fixture(scope="session")
+def coupled_repo(shared_git_repo: Callable[[str], Path]) -> Path:
     """Create a repo for coupling analysis.
 
     a+b always together (3 commits), a+c sometimes (2 commits),
     c alone once, d alone once. Total: 5 unique commits.
     """
+    repo = shared_git_repo("coupled_repo")
     # Commit 1: a+b+c together
-    commit_files(tmp_git_repo, {
+    commit_files(repo, {
         "a.py": "a_v1\n",
         "b.py": "b_v1\n",
         "c.py": "c_v1\n",
     }, "commit 1: a+b+c", days_ago=25)
 
     # Commit 2: a+b+c together
-    commit_files(tmp_git_repo, {
+    commit_files(repo, {
         "a.py": "a_v2\n",
         "b.py": "b_v2\n",
         "c.py": "c_v2\n",
     }, "commit 2: a+b+c", days_ago=20)
 
     # Commit 3: a+b together
-    commit_files(tmp_git_repo, {
+    commit_files(repo, {
         "a.py": "a_v3\n",
         "b.py": "b_v3\n",
     }, "commit 3: a+b", days_ago=15)
 
     # Commit 4: c alone
-    commit_files(tmp_git_repo, {
+    commit_files(repo, {
         "c.py": "c_v3\n",
     }, "commit 4: c alone", days_ago=10)
 
     # Commit 5: d alone
-    commit_files(tmp_git_repo, {
+    commit_files(repo, {
         "d.py": "d_v1\n",
     }, "commit 5: d alone", days_ago=5)
 
-    return tmp_git_repo
+    return repo
 
 
 @pytest.fixture
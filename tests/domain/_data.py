@@ -0,0 +1,13 @@
+from datetime import datetime, timezone
+
+from git_xrays.domain.models import DXMetrics
+
+DT = datetime(2024, 1, 1, tzinfo=timezone.utc)
+DT_RANGE = (
+    datetime(2024, 3, 1, tzinfo=timezone.utc),
+    datetime(2024, 6, 1, tzinfo=timezone.utc),
+)
+DX_METRICS = DXMetrics(
+    throughput=0.65, feedback_delay=0.82,
+    focus_ratio=0.71, cognitive_load=0.42,
+)
@@ -1,6 +1,8 @@
 import dataclasses
-from datetime import datetime, timezone
 
+import pytest
+
+from git_xrays.domain import models
 from git_xrays.domain.models import (
     AnemicReport,
     AuthorContribution,
@@ -31,27 +33,19 @@ from git_xrays.domain.models import (
     KnowledgeReport,
     RepoSummary,
 )
+from tests.domain._data import DT, DT_RANGE, DX_METRICS
 
 
 class TestRepoSummary:
     def test_creation(self):
-        dt = datetime(2024, 1, 1, tzinfo=timezone.utc)
         s = RepoSummary(
             repo_path="/repo", commit_count=10,
-            first_commit_date=dt, last_commit_date=dt,
+            first_commit_date=DT, last_commit_date=DT,
         )
         assert s.repo_path == "/repo"
         assert s.commit_count == 10
-        assert s.first_commit_date == dt
-        assert s.last_commit_date == dt
-
-    def test_frozen(self):
-        s = RepoSummary(
-            repo_path="/repo", commit_count=1,
-            first_commit_date=None, last_commit_date=None,
-        )
-        with __import__("pytest").raises(dataclasses.FrozenInstanceError):
-            s.commit_count = 5  # type: ignore[misc]
+        assert s.first_commit_date == DT
+        assert s.last_commit_date == DT
 
     def test_none_dates(self):
         s = RepoSummary(
@@ -64,28 +58,28 @@ class TestRepoSummary:
 
 class TestFileChange:
     def test_creation(self):
-        dt = datetime(2024, 6, 15, tzinfo=timezone.utc)
         fc = FileChange(
-            commit_hash="abc123", date=dt,
+            commit_hash="abc123", date=DT,
             file_path="src/main.py", lines_added=10, lines_deleted=3,
             author_name="Alice", author_email="alice@example.com",
         )
         assert fc.commit_hash == "abc123"
-        assert fc.date == dt
+        assert fc.date == DT
         assert fc.file_path == "src/main.py"
         assert fc.lines_added == 10
         assert fc.lines_deleted == 3
         assert fc.author_name == "Alice"
         assert fc.author_email == "alice@example.com"
 
-    def test_frozen(self):
-        fc = FileChange(
-            commit_hash="abc", date=datetime.now(timezone.utc),
-            file_path="f.py", lines_added=1, lines_deleted=0,
-            author_name="Alice", author_email="alice@example.com",
-        )
-        with __import__("pytest").raises(dataclasses.FrozenInstanceError):
-            fc.lines_added = 99  # type: ignore[misc]
+    def test_hashable_by_value(self):
+        def make():
+            return FileChange(
+                commit_hash="abc", date=DT,
+                file_path="f.py", lines_added=1, lines_deleted=0,
+                author_name="Alice", author_email="alice@example.com",
+            )
+        assert make() == make()
+        assert len({make(), make()}) == 1
 
 
 class TestFileMetrics:
@@ -100,40 +94,30 @@ class TestFileMetrics:
         assert fm.hotspot_score == 0.75
         assert fm.rework_ratio == 0.8
 
-    def test_frozen(self):
-        fm = FileMetrics(
-            file_path="a.py", change_frequency=1, code_churn=10,
-            hotspot_score=1.0, rework_ratio=0.0, file_size=0,
-        )
-        with __import__("pytest").raises(dataclasses.FrozenInstanceError):
-            fm.hotspot_score = 0.5  # type: ignore[misc]
-
 
 class TestHotspotReport:
     def test_creation(self):
-        dt = datetime(2024, 1, 1, tzinfo=timezone.utc)
         fm = FileMetrics(
             file_path="a.py", change_frequency=2, code_churn=50,
             hotspot_score=1.0, rework_ratio=0.5, file_size=0,
         )
         report = HotspotReport(
             repo_path="/repo", window_days=90,
-            from_date=dt, to_date=dt,
-            total_commits=5, files=[fm],
+            from_date=DT, to_date=DT,
+            total_commits=5, files=(fm,),
         )
         assert report.repo_path == "/repo"
         assert report.window_days == 90
         assert report.total_commits == 5
         assert len(report.files) == 1
 
-    def test_empty_files_list(self):
-        dt = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    def test_empty_files(self):
         report = HotspotReport(
             repo_path="/repo", window_days=30,
-            from_date=dt, to_date=dt,
-            total_commits=0, files=[],
+            from_date=DT, to_date=DT,
+            total_commits=0, files=(),
         )
-        assert report.files == []
+        assert report.files == ()
         assert report.total_commits == 0
 
 
@@ -151,15 +135,6 @@ class TestAuthorContribution:
         assert ac.proportion == 0.6
         assert ac.weighted_proportion == 0.7
 
-    def test_frozen(self):
-        ac = AuthorContribution(
-            author_name="Alice", author_email="alice@example.com",
-            change_count=1, total_churn=10, proportion=1.0,
-            weighted_proportion=1.0,
-        )
-        with __import__("pytest").raises(dataclasses.FrozenInstanceError):
-            ac.proportion = 0.5  # type: ignore[misc]
-
 
 class TestFileKnowledge:
     def test_creation(self):
@@ -171,7 +146,7 @@ class TestFileKnowledge:
         fk = FileKnowledge(
             file_path="main.py", knowledge_concentration=0.75,
             primary_author="Alice", primary_author_pct=0.8,
-            is_knowledge_island=True, author_count=2, authors=[ac],
+            is_knowledge_island=True, author_count=2, authors=(ac,),
         )
         assert fk.file_path == "main.py"
         assert fk.knowledge_concentration == 0.75
@@ -181,42 +156,21 @@ class TestFileKnowledge:
         assert fk.author_count == 2
         assert len(fk.authors) == 1
 
-    def test_frozen(self):
-        fk = FileKnowledge(
-            file_path="a.py", knowledge_concentration=0.5,
-            primary_author="Bob", primary_author_pct=0.5,
-            is_knowledge_island=False, author_count=2, authors=[],
-        )
-        with __import__("pytest").raises(dataclasses.FrozenInstanceError):
-            fk.knowledge_concentration = 0.0  # type: ignore[misc]
-
 
 class TestKnowledgeReport:
     def test_creation(self):
-        dt = datetime(2024, 1, 1, tzinfo=timezone.utc)
         report = KnowledgeReport(
             repo_path="/repo", window_days=90,
-            from_date=dt, to_date=dt,
+            from_date=DT, to_date=DT,
             total_commits=10, developer_risk_index=0.3,
-            knowledge_island_count=1, files=[],
+            knowledge_island_count=1, files=(),
         )
         assert report.repo_path == "/repo"
         assert report.window_days == 90
         assert report.total_commits == 10
         assert report.developer_risk_index == 0.3
         assert report.knowledge_island_count == 1
-        assert report.files == []
-
-    def test_frozen(self):
-        dt = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        report = KnowledgeReport(
-            repo_path="/repo", window_days=90,
-            from_date=dt, to_date=dt,
-            total_commits=0, developer_risk_index=0.0,
-            knowledge_island_count=0, files=[],
-        )
-        with __import__("pytest").raises(dataclasses.FrozenInstanceError):
-            report.developer_risk_index = 0.5  # type: ignore[misc]
+        assert report.files == ()
 
 
 class TestCouplingPair:
@@ -236,16 +190,6 @@ class TestCouplingPair:
         assert cp.expected_cochange == 1.5
         assert cp.lift == 2.0
 
-    def test_frozen(self):
-        cp = CouplingPair(
-            file_a="a.py", file_b="b.py",
-            shared_commits=1, total_commits=5,
-            coupling_strength=0.5, support=0.2,
-            expected_cochange=1.0, lift=1.0,
-        )
-        with __import__("pytest").raises(dataclasses.FrozenInstanceError):
-            cp.coupling_strength = 0.0  # type: ignore[misc]
-
     def test_perfect_coupling(self):
         cp = CouplingPair(
             file_a="x.py", file_b="y.py",
@@ -275,17 +219,6 @@ class TestFilePain:
         assert fp.distance_normalized == 0.75
         assert fp.pain_score == 0.3
 
-    def test_frozen(self):
-        fp = FilePain(
-            file_path="a.py",
-            size_raw=10, size_normalized=1.0,
-            volatility_raw=1, volatility_normalized=1.0,
-            distance_raw=0.5, distance_normalized=1.0,
-            pain_score=1.0,
-        )
-        with __import__("pytest").raises(dataclasses.FrozenInstanceError):
-            fp.pain_score = 0.0  # type: ignore[misc]
-
     def test_zero_pain_when_dimension_zero(self):
         fp = FilePain(
             file_path="a.py",
@@ -299,32 +232,19 @@ class TestFilePain:
 
 class TestCouplingReport:
     def test_creation(self):
-        dt = datetime(2024, 1, 1, tzinfo=timezone.utc)
         report = CouplingReport(
             repo_path="/repo", window_days=90,
-            from_date=dt, to_date=dt,
+            from_date=DT, to_date=DT,
             total_commits=10,
-            coupling_pairs=[], file_pain=[],
+            coupling_pairs=(), file_pain=(),
         )
         assert report.repo_path == "/repo"
         assert report.window_days == 90
         assert report.total_commits == 10
-        assert report.coupling_pairs == []
-        assert report.file_pain == []
-
-    def test_frozen(self):
-        dt = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        report = CouplingReport(
-            repo_path="/repo", window_days=90,
-            from_date=dt, to_date=dt,
-            total_commits=0,
-            coupling_pairs=[], file_pain=[],
-        )
-        with __import__("pytest").raises(dataclasses.FrozenInstanceError):
-            report.total_commits = 5  # type: ignore[misc]
+        assert report.coupling_pairs == ()
+        assert report.file_pain == ()
 
     def test_with_pairs_and_pain(self):
-        dt = datetime(2024, 1, 1, tzinfo=timezone.utc)
         pair = CouplingPair(
             file_a="a.py", file_b="b.py",
             shared_commits=3, total_commits=5,
@@ -340,9 +260,9 @@ class TestCouplingReport:
         )
         report = CouplingReport(
             repo_path="/repo", window_days=90,
-            from_date=dt, to_date=dt,
+            from_date=DT, to_date=DT,
             total_commits=5,
-            coupling_pairs=[pair], file_pain=[pain],
+            coupling_pairs=(pair,), file_pain=(pain,),
         )
         assert len(report.coupling_pairs) == 1
         assert len(report.file_pain) == 1
@@ -372,33 +292,23 @@ class TestFileHotspotDelta:
         assert delta.frequency_delta == 3
         assert delta.status == "degraded"
 
-    def test_frozen(self):
+    @pytest.mark.parametrize(
+        "status", ["unchanged", "improved", "degraded", "new", "removed"],
+    )
+    def test_status_values(self, status):
         delta = FileHotspotDelta(
             file_path="a.py",
-            from_score=0.5, to_score=0.5, score_delta=0.0,
-            from_churn=10, to_churn=10, churn_delta=0,
-            from_frequency=1, to_frequency=1, frequency_delta=0,
-            status="unchanged",
+            from_score=0.0, to_score=0.0, score_delta=0.0,
+            from_churn=0, to_churn=0, churn_delta=0,
+            from_frequency=0, to_frequency=0, frequency_delta=0,
+            status=status,
         )
-        with __import__("pytest").raises(dataclasses.FrozenInstanceError):
-            delta.score_delta = 1.0  # type: ignore[misc]
-
-    def test_status_values(self):
-        for status in ["unchanged", "improved", "degraded", "new", "removed"]:
-            delta = FileHotspotDelta(
-                file_path="a.py",
-                from_score=0.0, to_score=0.0, score_delta=0.0,
-                from_churn=0, to_churn=0, churn_delta=0,
-                from_frequency=0, to_frequency=0, frequency_delta=0,
-                status=status,
-            )
-            assert delta.status == status
+        assert delta.status == status
 
 
 class TestComparisonReport:
     def test_creation(self):
-        dt1 = datetime(2024, 3, 1, tzinfo=timezone.utc)
-        dt2 = datetime(2024, 6, 1, tzinfo=timezone.utc)
+        dt1, dt2 = DT_RANGE
         delta = FileHotspotDelta(
             file_path="a.py",
             from_score=0.5, to_score=0.8, score_delta=0.3,
@@ -410,7 +320,7 @@ class TestComparisonReport:
             repo_path="/repo", from_ref="v1.0", to_ref="v2.0",
             from_date=dt1, to_date=dt2, window_days=90,
             from_total_commits=42, to_total_commits=58,
-            files=[delta],
+            files=(delta,),
             new_hotspot_count=1, removed_hotspot_count=0,
             improved_count=0, degraded_count=1,
         )
@@ -428,28 +338,15 @@ class TestComparisonReport:
         assert report.improved_count == 0
         assert report.degraded_count == 1
 
-    def test_frozen(self):
-        dt = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        report = ComparisonReport(
-            repo_path="/repo", from_ref="a", to_ref="b",
-            from_date=dt, to_date=dt, window_days=90,
-            from_total_commits=0, to_total_commits=0,
-            files=[], new_hotspot_count=0, removed_hotspot_count=0,
-            improved_count=0, degraded_count=0,
-        )
-        with __import__("pytest").raises(dataclasses.FrozenInstanceError):
-            report.degraded_count = 5  # type: ignore[misc]
-
     def test_empty_files(self):
-        dt = datetime(2024, 1, 1, tzinfo=timezone.utc)
         report = ComparisonReport(
             repo_path="/repo", from_ref="a", to_ref="b",
-            from_date=dt, to_date=dt, window_days=90,
+            from_date=DT, to_date=DT, window_days=90,
             from_total_commits=0, to_total_commits=0,
-            files=[], new_hotspot_count=0, removed_hotspot_count=0,
+            files=(), new_hotspot_count=0, removed_hotspot_count=0,
             improved_count=0, degraded_count=0,
         )
-        assert report.files == []
+        assert report.files == ()
         assert report.new_hotspot_count == 0
 
 
@@ -480,16 +377,6 @@ class TestClassMetrics:
         assert cm.orchestration_pressure == 0.0
         assert cm.ams == 0.0
 
-    def test_frozen(self):
-        cm = ClassMetrics(
-            class_name="X", file_path="x.py",
-            field_count=1, method_count=0, behavior_method_count=0,
-            dunder_method_count=0, property_count=0,
-            dbsi=1.0, logic_density=0.0, orchestration_pressure=1.0, ams=1.0,
-        )
-        with __import__("pytest").raises(dataclasses.FrozenInstanceError):
-            cm.field_count = 99  # type: ignore[misc]
-
 
 class TestFileAnemia:
     def test_creation(self):
@@ -504,7 +391,7 @@ class TestFileAnemia:
             class_count=1,
             anemic_class_count=1,
             worst_ams=1.0,
-            classes=[cm],
+            classes=(cm,),
             touch_count=3,
         )
         assert fa.file_path == "foo.py"
@@ -514,14 +401,6 @@ class TestFileAnemia:
         assert len(fa.classes) == 1
         assert fa.touch_count == 3
 
-    def test_frozen(self):
-        fa = FileAnemic(
-            file_path="a.py", class_count=0, anemic_class_count=0,
-            worst_ams=0.0, classes=[], touch_count=0,
-        )
-        with __import__("pytest").raises(dataclasses.FrozenInstanceError):
-            fa.class_count = 5  # type: ignore[misc]
-
 
 class TestAnemiaReport:
     def test_creation(self):
@@ -534,7 +413,7 @@ class TestAnemiaReport:
             anemic_percentage=20.0,
             average_ams=0.35,
             ams_threshold=0.5,
-            files=[],
+            files=(),
         )
         assert report.repo_path == "/repo"
         assert report.ref is None
@@ -544,7 +423,7 @@ class TestAnemiaReport:
         assert report.anemic_percentage == 20.0
         assert report.average_ams == 0.35
         assert report.ams_threshold == 0.5
-        assert report.files == []
+        assert report.files == ()
 
 
 class TestFunctionComplexity:
@@ -571,16 +450,6 @@ class TestFunctionComplexity:
         assert fc.branch_count == 4
         assert fc.exception_paths == 1
 
-    def test_frozen(self):
-        fc = FunctionComplexity(
-            function_name="f", file_path="a.py", class_name=None,
-            line_number=1, length=1, cyclomatic_complexity=1,
-            cognitive_complexity=0,
-            max_nesting_depth=0, branch_count=0, exception_paths=0,
-        )
-        with __import__("pytest").raises(dataclasses.FrozenInstanceError):
-            fc.cyclomatic_complexity = 99  # type: ignore[misc]
-
     def test_method_with_class_name(self):
         fc = FunctionComplexity(
             function_name="validate",
@@ -619,7 +488,7 @@ class TestFileComplexity:
             max_nesting=2,
             avg_cognitive=0.0,
             max_cognitive=0,
-            functions=[func],
+            functions=(func,),
         )
         assert fc.file_path == "svc.py"
         assert fc.function_count == 1
@@ -633,34 +502,24 @@ class TestFileComplexity:
         assert fc.max_nesting == 2
         assert len(fc.functions) == 1
 
-    def test_frozen(self):
-        fc = FileComplexity(
-            file_path="a.py", function_count=0, total_complexity=0,
-            avg_complexity=0.0, max_complexity=0, worst_function="",
-            avg_length=0.0, max_length=0, avg_nesting=0.0, max_nesting=0,
-            avg_cognitive=0.0, max_cognitive=0,
-            functions=[],
-        )
-        with __import__("pytest").raises(dataclasses.FrozenInstanceError):
-            fc.function_count = 5  # type: ignore[misc]
-
     def test_empty(self):
         fc = FileComplexity(
             file_path="empty.py", function_count=0, total_complexity=0,
             avg_complexity=0.0, max_complexity=0, worst_function="",
             avg_length=0.0, max_length=0, avg_nesting=0.0, max_nesting=0,
             avg_cognitive=0.0, max_cognitive=0,
-            functions=[],
+            functions=(),
         )
-        assert fc.functions == []
+        assert fc.functions == ()
         assert fc.worst_function == ""
 
 
 class TestComplexityReport:
-    def test_creation(self):
+    @pytest.mark.parametrize("ref", [None, "v1.0"])
+    def test_creation(self, ref):
         report = ComplexityReport(
             repo_path="/repo",
-            ref=None,
+            ref=ref,
             total_files=5,
             total_functions=20,
             avg_complexity=4.5,
@@ -671,10 +530,10 @@ class TestComplexityReport:
             max_length=45,
             avg_cognitive=0.0,
             max_cognitive=0,
-            files=[],
+            files=(),
         )
         assert report.repo_path == "/repo"
-        assert report.ref is None
+        assert report.ref == ref
         assert report.total_files == 5
         assert report.total_functions == 20
         assert report.avg_complexity == 4.5
@@ -683,62 +542,32 @@ class TestComplexityReport:
         assert report.complexity_threshold == 10
         assert report.avg_length == 12.0
         assert report.max_length == 45
-        assert report.files == []
-
-    def test_frozen(self):
-        report = ComplexityReport(
-            repo_path="/repo", ref=None, total_files=0, total_functions=0,
-            avg_complexity=0.0, max_complexity=0, high_complexity_count=0,
-            complexity_threshold=10, avg_length=0.0, max_length=0,
-            avg_cognitive=0.0, max_cognitive=0, files=[],
-        )
-        with __import__("pytest").raises(dataclasses.FrozenInstanceError):
-            report.total_functions = 99  # type: ignore[misc]
-
-    def test_with_ref(self):
-        report = ComplexityReport(
-            repo_path="/repo", ref="v1.0", total_files=0, total_functions=0,
-            avg_complexity=0.0, max_complexity=0, high_complexity_count=0,
-            complexity_threshold=10, avg_length=0.0, max_length=0,
-            avg_cognitive=0.0, max_cognitive=0, files=[],
-        )
-        assert report.ref == "v1.0"
+        assert report.files == ()
 
 
 class TestCommitFeatures:
     def test_creation(self):
-        dt = datetime(2024, 6, 1, tzinfo=timezone.utc)
         cf = CommitFeatures(
-            commit_hash="abc123", date=dt,
+            commit_hash="abc123", date=DT,
             file_count=3, total_churn=150, add_ratio=0.7,
         )
         assert cf.commit_hash == "abc123"
-        assert cf.date == dt
+        assert cf.date == DT
         assert cf.file_count == 3
         assert cf.total_churn == 150
         assert cf.add_ratio == 0.7
 
-    def test_frozen(self):
-        dt = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        cf = CommitFeatures(
-            commit_hash="abc", date=dt,
-            file_count=1, total_churn=10, add_ratio=0.5,
-        )
-        with __import__("pytest").raises(dataclasses.FrozenInstanceError):
-            cf.total_churn = 99  # type: ignore[misc]
-
 
 class TestClusterSummary:
     def test_creation(self):
-        dt = datetime(2024, 6, 1, tzinfo=timezone.utc)
         commit = CommitFeatures(
-            commit_hash="abc", date=dt,
+            commit_hash="abc", date=DT,
             file_count=2, total_churn=50, add_ratio=0.8,
         )
         cs = ClusterSummary(
             cluster_id=0, label="feature", size=5,
             centroid_file_count=3.0, centroid_total_churn=120.0,
-            centroid_add_ratio=0.75, commits=[commit],
+            centroid_add_ratio=0.75, commits=(commit,),
         )
         assert cs.cluster_id == 0
         assert cs.label == "feature"
@@ -748,15 +577,6 @@ class TestClusterSummary:
         assert cs.centroid_add_ratio == 0.75
         assert len(cs.commits) == 1
 
-    def test_frozen(self):
-        cs = ClusterSummary(
-            cluster_id=0, label="mixed", size=1,
-            centroid_file_count=1.0, centroid_total_churn=10.0,
-            centroid_add_ratio=0.5, commits=[],
-        )
-        with __import__("pytest").raises(dataclasses.FrozenInstanceError):
-            cs.size = 99  # type: ignore[misc]
-
 
 class TestClusterDrift:
     def test_creation(self):
@@ -771,25 +591,15 @@ class TestClusterDrift:
         assert cd.drift == -20.0
         assert cd.trend == "shrinking"
 
-    def test_frozen(self):
-        cd = ClusterDrift(
-            cluster_label="bugfix",
-            first_half_pct=50.0, second_half_pct=50.0,
-            drift=0.0, trend="stable",
-        )
-        with __import__("pytest").raises(dataclasses.FrozenInstanceError):
-            cd.drift = 10.0  # type: ignore[misc]
-
 
 class TestClusteringReport:
     def test_creation(self):
-        dt1 = datetime(2024, 3, 1, tzinfo=timezone.utc)
-        dt2 = datetime(2024, 6, 1, tzinfo=timezone.utc)
+        dt1, dt2 = DT_RANGE
         report = ClusteringReport(
             repo_path="/repo", window_days=90,
             from_date=dt1, to_date=dt2,
             total_commits=42, k=3, silhouette_score=0.72,
-            clusters=[], drift=[],
+            clusters=(), drift=(),
         )
         assert report.repo_path == "/repo"
         assert report.window_days == 90
@@ -798,19 +608,8 @@ class TestClusteringReport:
         assert report.total_commits == 42
         assert report.k == 3
         assert report.silhouette_score == 0.72
-        assert report.clusters == []
-        assert report.drift == []
-
-    def test_frozen(self):
-        dt = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        report = ClusteringReport(
-            repo_path="/repo", window_days=90,
-            from_date=dt, to_date=dt,
-            total_commits=0, k=1, silhouette_score=0.0,
-            clusters=[], drift=[],
-        )
-        with __import__("pytest").raises(dataclasses.FrozenInstanceError):
-            report.k = 5  # type: ignore[misc]
+        assert report.clusters == ()
+        assert report.drift == ()
 
 
 class TestFeatureAttribution:
@@ -826,14 +625,6 @@ class TestFeatureAttribution:
         assert fa.weight == 0.42
         assert fa.contribution == 0.35
 
-    def test_frozen(self):
-        fa = FeatureAttribution(
-            feature_name="pain_score", raw_value=0.5,
-            weight=0.3, contribution=0.15,
-        )
-        with __import__("pytest").raises(dataclasses.FrozenInstanceError):
-            fa.weight = 0.0  # type: ignore[misc]
-
 
 class TestFileEffort:
     def test_creation(self):
@@ -847,7 +638,7 @@ class TestFileEffort:
             proxy_label=0.72,
             commit_density=0.5,
             rework_ratio=0.6,
-            attributions=[attr],
+            attributions=(attr,),
         )
         assert fe.file_path == "service.py"
         assert fe.rei_score == 0.85
@@ -856,68 +647,40 @@ class TestFileEffort:
         assert fe.rework_ratio == 0.6
         assert len(fe.attributions) == 1
 
-    def test_frozen(self):
-        fe = FileEffort(
-            file_path="a.py", rei_score=0.5, proxy_label=0.3,
-            commit_density=0.1, rework_ratio=0.2, attributions=[],
-        )
-        with __import__("pytest").raises(dataclasses.FrozenInstanceError):
-            fe.rei_score = 0.0  # type: ignore[misc]
-
     def test_empty_attributions(self):
         fe = FileEffort(
             file_path="a.py", rei_score=0.0, proxy_label=0.0,
-            commit_density=0.0, rework_ratio=0.0, attributions=[],
+            commit_density=0.0, rework_ratio=0.0, attributions=(),
         )
-        assert fe.attributions == []
+        assert fe.attributions == ()
 
 
 class TestEffortReport:
-    def test_creation(self):
-        dt1 = datetime(2024, 3, 1, tzinfo=timezone.utc)
-        dt2 = datetime(2024, 6, 1, tzinfo=timezone.utc)
+    @pytest.mark.parametrize("total_files,feature_names,coefficients", [
+        (5, ["code_churn", "change_frequency", "pain_score",
+             "knowledge_concentration", "author_count"],
+         [0.3, 0.2, 0.15, 0.25, 0.1]),
+        (0, [], []),
+    ])
+    def test_creation(self, total_files, feature_names, coefficients):
+        dt1, dt2 = DT_RANGE
         report = EffortReport(
             repo_path="/repo", window_days=90,
             from_date=dt1, to_date=dt2,
-            total_files=5, model_r_squared=0.72,
+            total_files=total_files, model_r_squared=0.72,
             alpha=1.0,
-            feature_names=["code_churn", "change_frequency", "pain_score",
-                           "knowledge_concentration", "author_count"],
-            coefficients=[0.3, 0.2, 0.15, 0.25, 0.1],
-            files=[],
+            feature_names=feature_names,
+            coefficients=coefficients,
+            files=(),
         )
         assert report.repo_path == "/repo"
         assert report.window_days == 90
-        assert report.total_files == 5
+        assert report.total_files == total_files
         assert report.model_r_squared == 0.72
         assert report.alpha == 1.0
-        assert len(report.feature_names) == 5
-        assert len(report.coefficients) == 5
-        assert report.files == []
-
-    def test_frozen(self):
-        dt = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        report = EffortReport(
-            repo_path="/repo", window_days=90,
-            from_date=dt, to_date=dt,
-            total_files=0, model_r_squared=0.0,
-            alpha=1.0, feature_names=[], coefficients=[],
-            files=[],
-        )
-        with __import__("pytest").raises(dataclasses.FrozenInstanceError):
-            report.model_r_squared = 0.5  # type: ignore[misc]
-
-    def test_empty_files(self):
-        dt = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        report = EffortReport(
-            repo_path="/repo", window_days=90,
-            from_date=dt, to_date=dt,
-            total_files=0, model_r_squared=0.0,
-            alpha=1.0, feature_names=[], coefficients=[],
-            files=[],
-        )
-        assert report.files == []
-        assert report.total_files == 0
+        assert report.feature_names == feature_names
+        assert report.coefficients == coefficients
+        assert report.files == ()
 
 
 class TestFileCognitiveLoad:
@@ -937,16 +700,6 @@ class TestFileCognitiveLoad:
         assert fcl.change_rate_score == 0.88
         assert fcl.composite_load == 0.8425
 
-    def test_frozen(self):
-        fcl = FileCognitiveLoad(
-            file_path="a.py",
-            complexity_score=0.5, coordination_score=0.5,
-            knowledge_score=0.5, change_rate_score=0.5,
-            composite_load=0.5,
-        )
-        with __import__("pytest").raises(dataclasses.FrozenInstanceError):
-            fcl.composite_load = 0.0  # type: ignore[misc]
-
 
 class TestDXMetrics:
     def test_creation(self):
@@ -961,31 +714,18 @@ class TestDXMetrics:
         assert m.focus_ratio == 0.71
         assert m.cognitive_load == 0.42
 
-    def test_frozen(self):
-        m = DXMetrics(
-            throughput=0.5, feedback_delay=0.5,
-            focus_ratio=0.5, cognitive_load=0.5,
-        )
-        with __import__("pytest").raises(dataclasses.FrozenInstanceError):
-            m.throughput = 0.0  # type: ignore[misc]
-
 
 class TestDXReport:
     def test_creation(self):
-        dt1 = datetime(2024, 3, 1, tzinfo=timezone.utc)
-        dt2 = datetime(2024, 6, 1, tzinfo=timezone.utc)
-        metrics = DXMetrics(
-            throughput=0.65, feedback_delay=0.82,
-            focus_ratio=0.71, cognitive_load=0.42,
-        )
+        dt1, dt2 = DT_RANGE
         report = DXReport(
             repo_path="/repo", window_days=90,
             from_date=dt1, to_date=dt2,
             total_commits=42, total_files=15,
             dx_score=0.7234,
             weights=[0.3, 0.25, 0.25, 0.2],
-            metrics=metrics,
-            cognitive_load_files=[],
+            metrics=DX_METRICS,
+            cognitive_load_files=(),
         )
         assert report.repo_path == "/repo"
         assert report.window_days == 90
@@ -994,53 +734,229 @@ class TestDXReport:
         assert report.dx_score == 0.7234
         assert report.weights == [0.3, 0.25, 0.25, 0.2]
         assert report.metrics.throughput == 0.65
-        assert report.cognitive_load_files == []
+        assert report.cognitive_load_files == ()
 
-    def test_frozen(self):
-        dt = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        metrics = DXMetrics(
-            throughput=0.5, feedback_delay=0.5,
-            focus_ratio=0.5, cognitive_load=0.5,
-        )
+    @pytest.mark.parametrize("total_files,weights", [
+        (0, [0.3, 0.25, 0.25, 0.2]),
+        (5, [0.4, 0.3, 0.2, 0.1]),
+    ])
+    def test_weights_and_totals(self, total_files, weights):
         report = DXReport(
             repo_path="/repo", window_days=90,
-            from_date=dt, to_date=dt,
-            total_commits=0, total_files=0,
-            dx_score=0.0, weights=[0.25, 0.25, 0.25, 0.25],
-            metrics=metrics, cognitive_load_files=[],
-        )
-        with __import__("pytest").raises(dataclasses.FrozenInstanceError):
-            report.dx_score = 1.0  # type: ignore[misc]
-
-    def test_empty_files(self):
-        dt = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        metrics = DXMetrics(
-            throughput=0.0, feedback_delay=0.0,
-            focus_ratio=0.0, cognitive_load=0.0,
-        )
-        report = DXReport(
-            repo_path="/repo", window_days=90,
-            from_date=dt, to_date=dt,
-            total_commits=0, total_files=0,
-            dx_score=0.0, weights=[0.3, 0.25, 0.25, 0.2],
-            metrics=metrics, cognitive_load_files=[],
-        )
-        assert report.cognitive_load_files == []
-        assert report.total_files == 0
-
-    def test_weights(self):
-        dt = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        metrics = DXMetrics(
-            throughput=1.0, feedback_delay=1.0,
-            focus_ratio=1.0, cognitive_load=0.0,
-        )
-        weights = [0.4, 0.3, 0.2, 0.1]
-        report = DXReport(
-            repo_path="/repo", window_days=90,
-            from_date=dt, to_date=dt,
-            total_commits=10, total_files=5,
+            from_date=DT, to_date=DT,
+            total_commits=10, total_files=total_files,
             dx_score=1.0, weights=weights,
-            metrics=metrics, cognitive_load_files=[],
+            metrics=DX_METRICS, cognitive_load_files=(),
         )
-        assert report.weights == [0.4, 0.3, 0.2, 0.1]
+        assert report.weights == weights
         assert len(report.weights) == 4
+        assert report.total_files == total_files
+        assert report.cognitive_load_files == ()
+
+
+# (factory, field, new_value) — one row per domain model
+FROZEN_CASES = [
+    (lambda: RepoSummary(
+        repo_path="/repo", commit_count=1,
+        first_commit_date=None, last_commit_date=None,
+    ), "commit_count", 5),
+    (lambda: FileChange(
+        commit_hash="abc", date=DT,
+        file_path="f.py", lines_added=1, lines_deleted=0,
+        author_name="Alice", author_email="alice@example.com",
+    ), "lines_added", 99),
+    (lambda: FileMetrics(
+        file_path="a.py", change_frequency=1, code_churn=10,
+        hotspot_score=1.0, rework_ratio=0.0, file_size=0,
+    ), "hotspot_score", 0.5),
+    (lambda: HotspotReport(
+        repo_path="/repo", window_days=30,
+        from_date=DT, to_date=DT, total_commits=0, files=(),
+    ), "total_commits", 5),
+    (lambda: AuthorContribution(
+        author_name="Alice", author_email="alice@example.com",
+        change_count=1, total_churn=10, proportion=1.0,
+        weighted_proportion=1.0,
+    ), "proportion", 0.5),
+    (lambda: FileKnowledge(
+        file_path="a.py", knowledge_concentration=0.5,
+        primary_author="Bob", primary_author_pct=0.5,
+        is_knowledge_island=False, author_count=2, authors=(),
+    ), "knowledge_concentration", 0.0),
+    (lambda: KnowledgeReport(
+        repo_path="/repo", window_days=90,
+        from_date=DT, to_date=DT,
+        total_commits=0, developer_risk_index=0.0,
+        knowledge_island_count=0, files=(),
+    ), "developer_risk_index", 0.5),
+    (lambda: CouplingPair(
+        file_a="a.py", file_b="b.py",
+        shared_commits=1, total_commits=5,
+        coupling_strength=0.5, support=0.2,
+        expected_cochange=1.0, lift=1.0,
+    ), "coupling_strength", 0.0),
+    (lambda: FilePain(
+        file_path="a.py",
+        size_raw=10, size_normalized=1.0,
+        volatility_raw=1, volatility_normalized=1.0,
+        distance_raw=0.5, distance_normalized=1.0,
+        pain_score=1.0,
+    ), "pain_score", 0.0),
+    (lambda: CouplingReport(
+        repo_path="/repo", window_days=90,
+        from_date=DT, to_date=DT, total_commits=0,
+        coupling_pairs=(), file_pain=(),
+    ), "total_commits", 5),
+    (lambda: FileHotspotDelta(
+        file_path="a.py",
+        from_score=0.5, to_score=0.5, score_delta=0.0,
+        from_churn=10, to_churn=10, churn_delta=0,
+        from_frequency=1, to_frequency=1, frequency_delta=0,
+        status="unchanged",
+    ), "score_delta", 1.0),
+    (lambda: ComparisonReport(
+        repo_path="/repo", from_ref="a", to_ref="b",
+        from_date=DT, to_date=DT, window_days=90,
+        from_total_commits=0, to_total_commits=0,
+        files=(), new_hotspot_count=0, removed_hotspot_count=0,
+        improved_count=0, degraded_count=0,
+    ), "degraded_count", 5),
+    (lambda: ClassMetrics(
+        class_name="X", file_path="x.py",
+        field_count=1, method_count=0, behavior_method_count=0,
+        dunder_method_count=0, property_count=0,
+        dbsi=1.0, logic_density=0.0, orchestration_pressure=1.0, ams=1.0,
+    ), "field_count", 99),
+    (lambda: FileAnemic(
+        file_path="a.py", class_count=0, anemic_class_count=0,
+        worst_ams=0.0, classes=(), touch_count=0,
+    ), "class_count", 5),
+    (lambda: AnemicReport(
+        repo_path="/repo", ref=None, total_files=0, total_classes=0,
+        anemic_count=0, anemic_percentage=0.0, average_ams=0.0,
+        ams_threshold=0.5, files=(),
+    ), "anemic_count", 5),
+    (lambda: FunctionComplexity(
+        function_name="f", file_path="a.py", class_name=None,
+        line_number=1, length=1, cyclomatic_complexity=1,
+        cognitive_complexity=0,
+        max_nesting_depth=0, branch_count=0, exception_paths=0,
+    ), "cyclomatic_complexity", 99),
+    (lambda: FileComplexity(
+        file_path="a.py", function_count=0, total_complexity=0,
+        avg_complexity=0.0, max_complexity=0, worst_function="",
+        avg_length=0.0, max_length=0, avg_nesting=0.0, max_nesting=0,
+        avg_cognitive=0.0, max_cognitive=0,
+        functions=(),
+    ), "function_count", 5),
+    (lambda: ComplexityReport(
+        repo_path="/repo", ref=None, total_files=0, total_functions=0,
+        avg_complexity=0.0, max_complexity=0, high_complexity_count=0,
+        complexity_threshold=10, avg_length=0.0, max_length=0,
+        avg_cognitive=0.0, max_cognitive=0, files=(),
+    ), "total_functions", 99),
+    (lambda: CommitFeatures(
+        commit_hash="abc", date=DT,
+        file_count=1, total_churn=10, add_ratio=0.5,
+    ), "total_churn", 99),
+    (lambda: ClusterSummary(
+        cluster_id=0, label="mixed", size=1,
+        centroid_file_count=1.0, centroid_total_churn=10.0,
+        centroid_add_ratio=0.5, commits=(),
+    ), "size", 99),
+    (lambda: ClusterDrift(
+        cluster_label="bugfix",
+        first_half_pct=50.0, second_half_pct=50.0,
+        drift=0.0, trend="stable",
+    ), "drift", 10.0),
+    (lambda: ClusteringReport(
+        repo_path="/repo", window_days=90,
+        from_date=DT, to_date=DT,
+        total_commits=0, k=1, silhouette_score=0.0,
+        clusters=(), drift=(),
+    ), "k", 5),
+    (lambda: FeatureAttribution(
+        feature_name="pain_score", raw_value=0.5,
+        weight=0.3, contribution=0.15,
+    ), "weight", 0.0),
+    (lambda: FileEffort(
+        file_path="a.py", rei_score=0.5, proxy_label=0.3,
+        commit_density=0.1, rework_ratio=0.2, attributions=(),
+    ), "rei_score", 0.0),
+    (lambda: EffortReport(
+        repo_path="/repo", window_days=90,
+        from_date=DT, to_date=DT,
+        total_files=0, model_r_squared=0.0,
+        alpha=1.0, feature_names=[], coefficients=[],
+        files=(),
+    ), "model_r_squared", 0.5),
+    (lambda: FileCognitiveLoad(
+        file_path="a.py",
+        complexity_score=0.5, coordination_score=0.5,
+        knowledge_score=0.5, change_rate_score=0.5,
+        composite_load=0.5,
+    ), "composite_load", 0.0),
+    (lambda: DX_METRICS, "throughput", 0.0),
+    (lambda: DXReport(
+        repo_path="/repo", window_days=90,
+        from_date=DT, to_date=DT,
+        total_commits=0, total_files=0,
+        dx_score=0.0, weights=[0.25, 0.25, 0.25, 0.25],
+        metrics=DX_METRICS, cognitive_load_files=(),
+    ), "dx_score", 1.0),
+]
+
+
+class TestFrozenModels:
+    @pytest.mark.parametrize(
+        "factory,field,value", FROZEN_CASES,
+        ids=[type(factory()).__name__ for factory, _, _ in FROZEN_CASES],
+    )
+    def test_all_models_frozen(self, factory, field, value):
+        obj = factory()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            setattr(obj, field, value)
+
+
+DOMAIN_MODELS = [
+    obj for obj in vars(models).values()
+    if isinstance(obj, type) and dataclasses.is_dataclass(obj)
+]
+
+
+class TestSlottedModels:
+    @pytest.mark.parametrize("cls", DOMAIN_MODELS, ids=lambda c: c.__name__)
+    def test_declares_slots(self, cls):
+        assert "__slots__" in vars(cls)
+        assert "__dict__" not in vars(cls)
+
+    @pytest.mark.parametrize("cls", DOMAIN_MODELS, ids=lambda c: c.__name__)
+    def test_no_weakref_slot(self, cls):
+        assert not hasattr(cls, "__weakref__")
+
+    @pytest.mark.parametrize(
+        "factory", [case[0] for case in FROZEN_CASES],
+        ids=[type(factory()).__name__ for factory, _, _ in FROZEN_CASES],
+    )
+    def test_instances_have_no_dict(self, factory):
+        assert not hasattr(factory(), "__dict__")
+
+
+REPORT_MODELS = [cls for cls in DOMAIN_MODELS if cls.__name__.endswith("Report")]
+
+
+class TestReportIdentity:
+    @pytest.mark.parametrize("cls", REPORT_MODELS, ids=lambda c: c.__name__)
+    def test_reports_use_identity_equality(self, cls):
+        assert cls.__eq__ is object.__eq__
+        assert cls.__hash__ is object.__hash__
+
+    def test_equal_fields_are_distinct_reports(self):
+        def build():
+            return HotspotReport(
+                repo_path="/repo", window_days=30,
+                from_date=DT, to_date=DT, total_commits=0, files=(),
+            )
+        first, second = build(), build()
+        assert first != second
+        assert len({first, second}) == 2
@@ -0,0 +1,12 @@
+import pytest
+
+from git_xrays.domain.models import FileMetrics
+
+
+@pytest.fixture(scope="session")
+def single_hotspot_files():
+    """One mid-range hotspot record for a.py; frozen, so safe to share."""
+    return (
+        FileMetrics(file_path="a.py", change_frequency=5,
+                    code_churn=50, hotspot_score=0.5, rework_ratio=0.5, file_size=0),
+    )
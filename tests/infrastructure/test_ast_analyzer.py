@@ -3,6 +3,7 @@ import pytest
 from git_xrays.infrastructure.ast_analyzer import (
     analyze_class_source,
     analyze_file,
+    clear_analyze_file_cache,
     compute_touch_counts,
 )
 
@@ -295,6 +296,20 @@ class TestAnalyzeFile:
         assert result_low.anemic_class_count == 1
         assert result_high.anemic_class_count == 0
 
+    def test_repeated_source_is_memoized(self):
+        source = "class Foo:\n    x = 1\n"
+        first = analyze_file(source, "memo.py")
+        assert analyze_file(source, "memo.py") is first
+        assert analyze_file(source, "memo.py", ams_threshold=0.9) is not first
+
+    def test_clear_cache_drops_results(self):
+        source = "class Bar:\n    x = 1\n"
+        first = analyze_file(source, "memo.py")
+        clear_analyze_file_cache()
+        again = analyze_file(source, "memo.py")
+        assert again is not first
+        assert again == first
+
 
 # --- Step 7: Touch count (import analysis) ---
 
@@ -338,3 +353,69 @@ class TestTouchCount:
         }
         touches = compute_touch_counts(files)
         assert touches["standalone.py"] == 0
+
+    def test_comma_separated_and_aliased_imports_counted(self):
+        files = {
+            "foo.py": "x = 1",
+            "bar.py": "y = 2",
+            "app.py": "import os, foo as f, bar.sub\n",
+        }
+        touches = compute_touch_counts(files)
+        assert touches["foo.py"] == 1
+        assert touches["bar.py"] == 1
+
+    def test_relative_from_import_counted(self):
+        files = {
+            "models.py": "class Foo: pass",
+            "app.py": "    from .models import Foo\n",
+        }
+        touches = compute_touch_counts(files)
+        assert touches["models.py"] == 1
+
+    def test_spaceless_relative_from_import_counted(self):
+        files = {
+            "models.py": "class Foo: pass",
+            "app.py": "from.models import Foo\n",
+        }
+        touches = compute_touch_counts(files)
+        assert touches["models.py"] == 1
+
+    def test_imports_in_triple_quoted_strings_ignored(self):
+        files = {
+            "models.py": "class Foo: pass",
+            "app.py": (
+                'def f():\n'
+                '    """Usage:\n'
+                '\n'
+                '    import models\n'
+                '    """\n'
+                "    doc = '''\n"
+                "from models import Foo\n"
+                "'''\n"
+            ),
+        }
+        touches = compute_touch_counts(files)
+        assert touches["models.py"] == 0
+
+    def test_triple_quote_inside_string_literal_keeps_imports(self):
+        files = {
+            "models.py": "class Foo: pass",
+            "app.py": (
+                "def f(line):\n"
+                "    if line[:4] == 'r\"\"\"':\n"
+                "        import models\n"
+                "    return '\"\"\"'\n"
+            ),
+        }
+        touches = compute_touch_counts(files)
+        assert touches["models.py"] == 1
+
+    def test_semicolon_and_inline_imports_counted(self):
+        files = {
+            "foo.py": "x = 1",
+            "bar.py": "y = 2",
+            "app.py": "x = 1; import foo\nif not x: import bar\n",
+        }
+        touches = compute_touch_counts(files)
+        assert touches["foo.py"] == 1
+        assert touches["bar.py"] == 1
@@ -216,6 +216,21 @@ class TestKMeans:
         assert assignments[4] == assignments[5]
         assert len(set(assignments)) == 3
 
+    def test_converged_assignments_are_nearest_centroid(self):
+        # Tie-heavy integer grid: bound-based skipping must still yield the
+        # same first-index argmin a full scan would
+        points = [[float(x), float(y)] for x in range(6) for y in range(5)]
+        centroids, assignments = kmeans(points, k=4, seed=7)
+        for p, a in zip(points, assignments):
+            dists = [sum((pi - ci) ** 2 for pi, ci in zip(p, c)) ** 0.5 for c in centroids]
+            assert a == dists.index(min(dists))
+
+    def test_tolerance_stop_keeps_clear_clusters(self):
+        points = [[0, 0], [0, 1], [10, 10], [10, 11]]
+        _, exact = kmeans(points, k=2, seed=42, tol=0.0)
+        _, loose = kmeans(points, k=2, seed=42, tol=1.0)
+        assert loose == exact
+
 
 # --- Step 5: silhouette_score ---
 
@@ -266,25 +281,30 @@ class TestAutoSelectK:
             [[50, 50], [51, 50], [50, 51], [50.5, 50.5], [51, 51], [50, 50.5], [50.5, 50]] +
             [[100, 100], [101, 100], [100, 101], [100.5, 100.5], [101, 101], [100, 100.5], [100.5, 100]]
         )
-        k = auto_select_k(points, seed=42)
+        k, _, _ = auto_select_k(points, seed=42)
         assert k == 3
 
     def test_single_point_returns_k_min(self):
         points = [[5, 5]]
-        k = auto_select_k(points, seed=42)
+        k, _, _ = auto_select_k(points, seed=42)
         assert k == 2
 
     def test_two_identical_points_returns_k_min(self):
         points = [[5, 5], [5, 5]]
-        k = auto_select_k(points, seed=42)
+        k, _, _ = auto_select_k(points, seed=42)
         assert k == 2
 
     def test_respects_k_max(self):
         # Many groups but k_max=4
         points = [[i * 100, 0] for i in range(20)]
-        k = auto_select_k(points, k_max=4, seed=42)
+        k, _, _ = auto_select_k(points, k_max=4, seed=42)
         assert k <= 4
 
+    def test_returns_chosen_k_run(self):
+        points = [[0, 0], [1, 1], [10, 10], [11, 11], [20, 0], [21, 1]]
+        k, centroids, assignments = auto_select_k(points, seed=42)
+        assert (centroids, assignments) == kmeans(points, k=k, seed=42)
+
 
 # --- Step 7: label_cluster ---
 
@@ -1,6 +1,9 @@
 import textwrap
 
-from git_xrays.infrastructure.complexity_analyzer import analyze_file_complexity
+from git_xrays.infrastructure.complexity_analyzer import (
+    analyze_file_complexity,
+    clear_file_complexity_cache,
+)
 
 
 def _analyze_func(source: str, func_name: str = "f"):
@@ -281,7 +284,7 @@ class TestAnalyzeFileComplexity:
     def test_empty_file_returns_empty(self):
         result = analyze_file_complexity("", "empty.py")
         assert result.function_count == 0
-        assert result.functions == []
+        assert result.functions == ()
         assert result.worst_function == ""
 
     def test_single_function(self):
@@ -365,7 +368,27 @@ class TestAnalyzeFileComplexity:
     def test_syntax_error_returns_empty(self):
         result = analyze_file_complexity("def f(:\n", "bad.py")
         assert result.function_count == 0
-        assert result.functions == []
+        assert result.functions == ()
+
+    def test_source_without_def_returns_empty(self):
+        result = analyze_file_complexity("class Config:\n    x = 1\n", "cfg.py")
+        assert result.file_path == "cfg.py"
+        assert result.function_count == 0
+        assert result.functions == ()
+
+    def test_repeated_source_is_memoized(self):
+        source = "def f():\n    return 1\n"
+        first = analyze_file_complexity(source, "memo.py")
+        assert analyze_file_complexity(source, "memo.py") is first
+        assert analyze_file_complexity(source, "other.py") is not first
+
+    def test_clear_cache_drops_results(self):
+        source = "def g():\n    return 2\n"
+        first = analyze_file_complexity(source, "memo.py")
+        clear_file_complexity_cache()
+        again = analyze_file_complexity(source, "memo.py")
+        assert again is not first
+        assert again == first
 
 
 class TestComplexCombinations:
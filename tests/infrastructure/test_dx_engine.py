@@ -1,5 +1,8 @@
+from dataclasses import replace
 from datetime import datetime, timezone
 
+import pytest
+
 from git_xrays.domain.models import (
     ClusterSummary,
     CommitFeatures,
@@ -21,164 +24,79 @@ from git_xrays.infrastructure.dx_engine import (
 )
 
 
+_CLUSTER_PROTO = ClusterSummary(
+    cluster_id=0, label="feature", size=0,
+    centroid_file_count=1.0, centroid_total_churn=10.0,
+    centroid_add_ratio=0.5, commits=(),
+)
+
+
 def _make_cluster(label: str, size: int) -> ClusterSummary:
-    return ClusterSummary(
-        cluster_id=0, label=label, size=size,
-        centroid_file_count=1.0, centroid_total_churn=10.0,
-        centroid_add_ratio=0.5, commits=[],
-    )
+    return replace(_CLUSTER_PROTO, label=label, size=size)
 
 
 class TestComputeThroughput:
-    def test_all_feature_commits(self):
-        clusters = [_make_cluster("feature", 10)]
-        result = compute_throughput(clusters, window_days=90)
-        # 10 * 1.0 / (90 * 10) = 10/900 ≈ 0.0111
-        assert 0.0 < result <= 1.0
-
-    def test_all_bugfix_commits(self):
-        clusters = [_make_cluster("bugfix", 10)]
-        result = compute_throughput(clusters, window_days=90)
-        # bugfix weight=0.5, so 10*0.5/(90*10) = 5/900
-        assert result < compute_throughput(
-            [_make_cluster("feature", 10)], window_days=90
+    @pytest.mark.parametrize("clusters,window_days,expected", [
+        # weighted commits / (window_days * 10)
+        ([("feature", 10)], 90, 10 / 900),
+        ([("bugfix", 10)], 90, 5 / 900),
+        ([("feature", 5), ("bugfix", 5)], 90, 7.5 / 900),
+        ([("refactoring", 10)], 90, 8 / 900),
+        ([("config", 10)], 90, 3 / 900),
+        ([("feature", 1)], 90, 1 / 900),
+        ([("feature", 10000)], 1, 1.0),  # clamps to one
+        ([], 90, 0.0),
+    ])
+    def test_weighted_rate(self, clusters, window_days, expected):
+        result = compute_throughput(
+            [_make_cluster(label, size) for label, size in clusters],
+            window_days=window_days,
         )
+        assert result == pytest.approx(expected)
 
-    def test_mixed_clusters(self):
-        clusters = [
-            _make_cluster("feature", 5),
-            _make_cluster("bugfix", 5),
-        ]
-        result = compute_throughput(clusters, window_days=90)
-        # (5*1.0 + 5*0.5) / (90*10) = 7.5/900
-        assert 0.0 < result <= 1.0
-
-    def test_empty_clusters(self):
-        result = compute_throughput([], window_days=90)
-        assert result == 0.0
-
-    def test_high_commit_rate_clamps_to_one(self):
-        clusters = [_make_cluster("feature", 10000)]
-        result = compute_throughput(clusters, window_days=1)
-        assert result == 1.0
-
-    def test_low_commit_rate(self):
-        clusters = [_make_cluster("feature", 1)]
-        result = compute_throughput(clusters, window_days=90)
-        assert result < 0.1
-
-    def test_refactoring_weighted(self):
-        refactor = compute_throughput(
-            [_make_cluster("refactoring", 10)], window_days=90
-        )
-        feature = compute_throughput(
-            [_make_cluster("feature", 10)], window_days=90
-        )
-        # refactoring=0.8 < feature=1.0
-        assert refactor < feature
-
-    def test_config_weighted(self):
-        config = compute_throughput(
-            [_make_cluster("config", 10)], window_days=90
-        )
-        bugfix = compute_throughput(
-            [_make_cluster("bugfix", 10)], window_days=90
-        )
-        # config=0.3 < bugfix=0.5
-        assert config < bugfix
+    @pytest.mark.parametrize("lower,higher", [
+        ("bugfix", "feature"),       # 0.5 < 1.0
+        ("refactoring", "feature"),  # 0.8 < 1.0
+        ("config", "bugfix"),        # 0.3 < 0.5
+    ])
+    def test_label_weight_order(self, lower, higher):
+        low = compute_throughput([_make_cluster(lower, 10)], window_days=90)
+        high = compute_throughput([_make_cluster(higher, 10)], window_days=90)
+        assert low < high
 
 
 class TestComputeFeedbackDelay:
-    def test_high_density_low_rework(self):
-        densities = [0.9, 0.8]
-        rework_ratios = [0.1, 0.1]
+    @pytest.mark.parametrize("densities,rework_ratios,expected", [
+        # mean(densities) * (1 - mean(rework))
+        ([0.9, 0.8], [0.1, 0.1], 0.765),
+        ([0.1, 0.2], [0.9, 0.8], 0.0225),
+        ([0.5], [0.0], 0.5),
+        ([0.2, 0.4, 0.6], [0.1, 0.2, 0.3], 0.32),
+        ([0.0, 0.0], [0.5, 0.5], 0.0),
+        ([1.0, 1.0], [0.0, 0.0], 1.0),
+        ([], [], 0.0),
+    ])
+    def test_feedback_delay(self, densities, rework_ratios, expected):
         result = compute_feedback_delay(densities, rework_ratios)
-        # mean(densities) * (1 - mean(rework)) = 0.85 * 0.9 = 0.765
-        assert abs(result - 0.765) < 0.001
-
-    def test_low_density_high_rework(self):
-        densities = [0.1, 0.2]
-        rework_ratios = [0.9, 0.8]
-        result = compute_feedback_delay(densities, rework_ratios)
-        # mean(0.1, 0.2) * (1 - mean(0.9, 0.8)) = 0.15 * 0.15 = 0.0225
-        assert abs(result - 0.0225) < 0.001
-
-    def test_empty_files(self):
-        result = compute_feedback_delay([], [])
-        assert result == 0.0
-
-    def test_single_file_zero_rework(self):
-        result = compute_feedback_delay([0.5], [0.0])
-        # 0.5 * (1 - 0.0) = 0.5
-        assert abs(result - 0.5) < 0.001
-
-    def test_multiple_files_average(self):
-        densities = [0.2, 0.4, 0.6]
-        rework_ratios = [0.1, 0.2, 0.3]
-        result = compute_feedback_delay(densities, rework_ratios)
-        # mean(densities) = 0.4, mean(rework) = 0.2
-        # 0.4 * (1 - 0.2) = 0.32
-        assert abs(result - 0.32) < 0.001
-
-    def test_all_zero_density(self):
-        result = compute_feedback_delay([0.0, 0.0], [0.5, 0.5])
-        assert result == 0.0
-
-    def test_all_one_density_zero_rework(self):
-        result = compute_feedback_delay([1.0, 1.0], [0.0, 0.0])
-        assert abs(result - 1.0) < 0.001
+        assert result == pytest.approx(expected)
 
 
 class TestComputeFocusRatio:
-    def test_all_feature(self):
-        clusters = [_make_cluster("feature", 10)]
-        result = compute_focus_ratio(clusters)
-        assert result == 1.0
-
-    def test_all_bugfix(self):
-        clusters = [_make_cluster("bugfix", 10)]
-        result = compute_focus_ratio(clusters)
-        assert result == 0.0
-
-    def test_equal_feature_bugfix(self):
-        clusters = [
-            _make_cluster("feature", 5),
-            _make_cluster("bugfix", 5),
-        ]
-        result = compute_focus_ratio(clusters)
-        assert abs(result - 0.5) < 0.001
-
-    def test_feature_and_config(self):
-        clusters = [
-            _make_cluster("feature", 3),
-            _make_cluster("config", 7),
-        ]
-        result = compute_focus_ratio(clusters)
-        # 3 / (3 + 7) = 0.3
-        assert abs(result - 0.3) < 0.001
-
-    def test_mixed_excluded_from_denominator(self):
-        clusters = [
-            _make_cluster("feature", 5),
-            _make_cluster("bugfix", 5),
-            _make_cluster("mixed", 10),
-        ]
-        result = compute_focus_ratio(clusters)
-        # mixed excluded: 5 / (5 + 5) = 0.5
-        assert abs(result - 0.5) < 0.001
-
-    def test_empty_clusters(self):
-        result = compute_focus_ratio([])
-        assert result == 0.5
-
-    def test_refactoring_in_denominator(self):
-        clusters = [
-            _make_cluster("feature", 4),
-            _make_cluster("refactoring", 6),
-        ]
-        result = compute_focus_ratio(clusters)
-        # 4 / (4 + 6) = 0.4
-        assert abs(result - 0.4) < 0.001
+    @pytest.mark.parametrize("clusters,expected", [
+        ([("feature", 10)], 1.0),
+        ([("bugfix", 10)], 0.0),
+        ([("feature", 5), ("bugfix", 5)], 0.5),
+        ([("feature", 3), ("config", 7)], 0.3),
+        ([("feature", 4), ("refactoring", 6)], 0.4),
+        # mixed excluded: 5 / (5 + 5)
+        ([("feature", 5), ("bugfix", 5), ("mixed", 10)], 0.5),
+        ([], 0.5),
+    ])
+    def test_focus_ratio(self, clusters, expected):
+        result = compute_focus_ratio(
+            [_make_cluster(label, size) for label, size in clusters],
+        )
+        assert result == pytest.approx(expected)
 
 
 class TestComputeCognitiveLoadPerFile:
@@ -191,7 +109,7 @@ class TestComputeCognitiveLoadPerFile:
             FileKnowledge(
                 file_path="a.py", knowledge_concentration=0.7,
                 primary_author="Alice", primary_author_pct=0.7,
-                is_knowledge_island=False, author_count=2, authors=[],
+                is_knowledge_island=False, author_count=2, authors=(),
             ),
         ]
         pain_files = [
@@ -210,7 +128,7 @@ class TestComputeCognitiveLoadPerFile:
                 max_complexity=7, worst_function="process",
                 avg_length=15.0, max_length=20,
                 avg_nesting=2.0, max_nesting=3,
-                avg_cognitive=0.0, max_cognitive=0, functions=[],
+                avg_cognitive=0.0, max_cognitive=0, functions=(),
             ),
         ]
         result = compute_cognitive_load_per_file(
@@ -234,20 +152,16 @@ class TestComputeCognitiveLoadPerFile:
             assert 0.0 <= f.knowledge_score <= 1.0
             assert 0.0 <= f.change_rate_score <= 1.0
 
-    def test_composite_is_weighted_sum(self):
-        hotspot_files = [
-            FileMetrics(file_path="a.py", change_frequency=5,
-                        code_churn=50, hotspot_score=0.5, rework_ratio=0.5, file_size=0),
-        ]
+    def test_composite_is_weighted_sum(self, single_hotspot_files):
         knowledge_files = [
             FileKnowledge(
                 file_path="a.py", knowledge_concentration=0.6,
                 primary_author="Alice", primary_author_pct=0.6,
-                is_knowledge_island=False, author_count=2, authors=[],
+                is_knowledge_island=False, author_count=2, authors=(),
             ),
         ]
         result = compute_cognitive_load_per_file(
-            hotspot_files, knowledge_files, [], [],
+            single_hotspot_files, knowledge_files, [], [],
         )
         f = result[0]
         expected = (
@@ -267,7 +181,7 @@ class TestComputeCognitiveLoadPerFile:
                 max_complexity=20, worst_function="f",
                 avg_length=50.0, max_length=50,
                 avg_nesting=5.0, max_nesting=5,
-                avg_cognitive=20.0, max_cognitive=20, functions=[],
+                avg_cognitive=20.0, max_cognitive=20, functions=(),
             ),
             FileComplexity(
                 file_path="simple.py", function_count=1,
@@ -275,7 +189,7 @@ class TestComputeCognitiveLoadPerFile:
                 max_complexity=1, worst_function="g",
                 avg_length=5.0, max_length=5,
                 avg_nesting=1.0, max_nesting=1,
-                avg_cognitive=1.0, max_cognitive=1, functions=[],
+                avg_cognitive=1.0, max_cognitive=1, functions=(),
             ),
         ]
         hotspot_files = [
@@ -306,28 +220,16 @@ class TestComputeCognitiveLoadPerFile:
         assert result[1].file_path == "low.py"
         assert result[0].composite_load >= result[1].composite_load
 
-    def test_missing_complexity(self):
-        hotspot_files = [
-            FileMetrics(file_path="a.py", change_frequency=5,
-                        code_churn=50, hotspot_score=0.5, rework_ratio=0.5, file_size=0),
-        ]
-        result = compute_cognitive_load_per_file(hotspot_files, [], [], [])
+    def test_missing_complexity(self, single_hotspot_files):
+        result = compute_cognitive_load_per_file(single_hotspot_files, [], [], [])
         assert result[0].complexity_score == 0.0
 
-    def test_missing_coupling(self):
-        hotspot_files = [
-            FileMetrics(file_path="a.py", change_frequency=5,
-                        code_churn=50, hotspot_score=0.5, rework_ratio=0.5, file_size=0),
-        ]
-        result = compute_cognitive_load_per_file(hotspot_files, [], [], [])
+    def test_missing_coupling(self, single_hotspot_files):
+        result = compute_cognitive_load_per_file(single_hotspot_files, [], [], [])
         assert result[0].coordination_score == 0.0
 
-    def test_missing_knowledge(self):
-        hotspot_files = [
-            FileMetrics(file_path="a.py", change_frequency=5,
-                        code_churn=50, hotspot_score=0.5, rework_ratio=0.5, file_size=0),
-        ]
-        result = compute_cognitive_load_per_file(hotspot_files, [], [], [])
+    def test_missing_knowledge(self, single_hotspot_files):
+        result = compute_cognitive_load_per_file(single_hotspot_files, [], [], [])
         assert result[0].knowledge_score == 0.0
 
     def test_missing_commit_count(self):
@@ -336,7 +238,7 @@ class TestComputeCognitiveLoadPerFile:
             FileKnowledge(
                 file_path="orphan.py", knowledge_concentration=0.5,
                 primary_author="Bob", primary_author_pct=0.5,
-                is_knowledge_island=False, author_count=2, authors=[],
+                is_knowledge_island=False, author_count=2, authors=(),
             ),
         ]
         result = compute_cognitive_load_per_file([], knowledge_files, [], [])
@@ -362,12 +264,12 @@ class TestComputeCognitiveLoadPerFile:
             FileKnowledge(
                 file_path="a.py", knowledge_concentration=0.9,
                 primary_author="Alice", primary_author_pct=0.9,
-                is_knowledge_island=True, author_count=1, authors=[],
+                is_knowledge_island=True, author_count=1, authors=(),
             ),
             FileKnowledge(
                 file_path="b.py", knowledge_concentration=0.1,
                 primary_author="Bob", primary_author_pct=0.5,
-                is_knowledge_island=False, author_count=3, authors=[],
+                is_knowledge_island=False, author_count=3, authors=(),
             ),
         ]
         result = compute_cognitive_load_per_file(
@@ -1,3 +1,4 @@
+from dataclasses import replace
 from datetime import datetime, timedelta, timezone
 
 import pytest
@@ -107,21 +108,34 @@ class TestComputeEffortProxy:
 
 # --- build_feature_matrix ---
 
+_HOTSPOT_PROTO = FileMetrics(
+    file_path="", change_frequency=5, code_churn=100,
+    hotspot_score=0.5, rework_ratio=0.8, file_size=0,
+)
+_KNOWLEDGE_PROTO = FileKnowledge(
+    file_path="", knowledge_concentration=0.5,
+    primary_author="Alice", primary_author_pct=0.6,
+    is_knowledge_island=False, author_count=3, authors=(),
+)
+_PAIN_PROTO = FilePain(
+    file_path="", size_raw=100, size_normalized=0.5,
+    volatility_raw=5, volatility_normalized=0.5,
+    distance_raw=0.3, distance_normalized=0.3, pain_score=0.4,
+)
+
+
 def _make_hotspot(fp: str, churn: int = 100, freq: int = 5, rework: float = 0.8) -> FileMetrics:
-    return FileMetrics(file_path=fp, change_frequency=freq, code_churn=churn,
-                       hotspot_score=0.5, rework_ratio=rework, file_size=0)
+    return replace(_HOTSPOT_PROTO, file_path=fp, change_frequency=freq,
+                   code_churn=churn, rework_ratio=rework)
 
 
 def _make_knowledge(fp: str, kdi: float = 0.5, author_count: int = 3) -> FileKnowledge:
-    return FileKnowledge(file_path=fp, knowledge_concentration=kdi,
-                         primary_author="Alice", primary_author_pct=0.6,
-                         is_knowledge_island=False, author_count=author_count, authors=[])
+    return replace(_KNOWLEDGE_PROTO, file_path=fp, knowledge_concentration=kdi,
+                   author_count=author_count)
 
 
 def _make_pain(fp: str, pain: float = 0.4) -> FilePain:
-    return FilePain(file_path=fp, size_raw=100, size_normalized=0.5,
-                    volatility_raw=5, volatility_normalized=0.5,
-                    distance_raw=0.3, distance_normalized=0.3, pain_score=pain)
+    return replace(_PAIN_PROTO, file_path=fp, pain_score=pain)
 
 
 class TestBuildFeatureMatrix:
@@ -135,11 +149,10 @@ class TestBuildFeatureMatrix:
         assert len(matrix) == 1
         assert matrix[0] == [200, 8, 0.6, 0.7, 4, 0.7 * 0.6]
 
-    def test_missing_from_pain_uses_defaults(self):
+    def test_missing_from_pain_uses_defaults(self, single_hotspot_files):
         """File missing from pain → pain_score defaults to 0.0."""
-        hotspots = [_make_hotspot("a.py")]
         knowledge = [_make_knowledge("a.py")]
-        files, matrix = build_feature_matrix(["a.py"], hotspots, knowledge, [])
+        files, matrix = build_feature_matrix(["a.py"], single_hotspot_files, knowledge, [])
         assert matrix[0][2] == 0.0  # pain_score
         assert matrix[0][5] == 0.0  # knowledge_x_pain = 0.5 * 0.0
 
@@ -172,18 +185,17 @@ class TestBuildFeatureMatrix:
         assert matrix[0][0] == 100  # a.py churn
         assert matrix[1][0] == 200  # b.py churn
 
-    def test_interaction_feature_computed(self):
+    def test_interaction_feature_computed(self, single_hotspot_files):
         """Verify knowledge_x_pain = knowledge_concentration * pain_score."""
-        hotspots = [_make_hotspot("a.py")]
         knowledge = [_make_knowledge("a.py", kdi=0.8)]
         pain = [_make_pain("a.py", pain=0.6)]
-        _, matrix = build_feature_matrix(["a.py"], hotspots, knowledge, pain)
+        _, matrix = build_feature_matrix(["a.py"], single_hotspot_files, knowledge, pain)
         assert matrix[0][5] == pytest.approx(0.8 * 0.6)
 
-    def test_interaction_zero_when_missing(self):
+    def test_interaction_zero_when_missing(self, single_hotspot_files):
         """Missing knowledge or pain → interaction feature = 0.0."""
         # Missing knowledge
-        hotspots = [_make_hotspot("a.py")]
+        hotspots = single_hotspot_files
         pain = [_make_pain("a.py", pain=0.6)]
         _, matrix = build_feature_matrix(["a.py"], hotspots, [], pain)
         assert matrix[0][5] == 0.0  # kc=0.0 * 0.6 = 0.0
@@ -1,12 +1,72 @@
 import subprocess
+from collections.abc import Callable
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import pytest
 
 from git_xrays.application.use_cases import analyze_coupling, compare_hotspots
+from git_xrays.domain.models import ComparisonReport, CouplingReport, FileChange
 from git_xrays.infrastructure.git_cli_reader import GitCliReader
-from tests.conftest import commit_file
+from tests.conftest import RepoHead, commit_file
+
+HISTORY_PATHS = frozenset({"src/main.py", "src/utils.py"})
+MULTI_AUTHOR_NAMES = frozenset({"Alice", "Bob", "Carol"})
+MULTI_AUTHOR_EMAILS = frozenset(
+    {"alice@example.com", "bob@example.com", "carol@example.com"}
+)
+
+
+class CachedReader:
+    """Wraps a GitCliReader so each distinct file_changes query runs git once."""
+
+    def __init__(self, reader: GitCliReader) -> None:
+        self._reader = reader
+        self._changes: dict[
+            tuple[datetime | None, datetime | None], tuple[FileChange, ...]
+        ] = {}
+
+    def file_changes(
+        self, since: datetime | None = None, until: datetime | None = None
+    ) -> list[FileChange]:
+        key = (since, until)
+        if key not in self._changes:
+            self._changes[key] = tuple(self._reader.file_changes(since, until))
+        return list(self._changes[key])
+
+
+@pytest.fixture(scope="module")
+def cached_reader_factory() -> Callable[[Path], CachedReader]:
+    """Return one CachedReader per repo path for the whole module."""
+    readers: dict[str, CachedReader] = {}
+
+    def factory(repo: Path) -> CachedReader:
+        key = str(repo)
+        if key not in readers:
+            readers[key] = CachedReader(GitCliReader(key))
+        return readers[key]
+
+    return factory
+
+
+@pytest.fixture(scope="class")
+def coupling_report(coupled_repo: Path) -> CouplingReport:
+    """analyze_coupling over coupled_repo, computed once per test class."""
+    reader = GitCliReader(str(coupled_repo))
+    return analyze_coupling(reader, str(coupled_repo), 90)
+
+
+@pytest.fixture(scope="class")
+def tag_comparison(tagged_repo: Path) -> ComparisonReport:
+    """compare_hotspots from v1.0 to v2.0, computed once per test class."""
+    reader = GitCliReader(str(tagged_repo))
+    return compare_hotspots(reader, str(tagged_repo), 90, "v1.0", "v2.0")
+
+
+@pytest.fixture(scope="module")
+def history_reader(git_repo_with_history: Path) -> GitCliReader:
+    """One reader over git_repo_with_history shared by the module."""
+    return GitCliReader(str(git_repo_with_history))
 
 
 class TestGitCliReaderInit:
@@ -35,49 +95,47 @@ class TestCommitDates:
         assert reader.first_commit_date() is None
         assert reader.last_commit_date() is None
 
-    def test_dates_populated(self, git_repo_with_history: Path):
+    def test_dates_populated(self, git_repo_with_history: Path, history_head: RepoHead):
         reader = GitCliReader(str(git_repo_with_history))
         first = reader.first_commit_date()
         last = reader.last_commit_date()
         assert first is not None
         assert last is not None
         assert first < last
+        assert last == history_head.date
 
 
 class TestFileChanges:
-    def test_returns_all_changes(self, git_repo_with_history: Path):
-        reader = GitCliReader(str(git_repo_with_history))
+    def test_returns_all_changes(self, git_repo_with_history: Path, cached_reader_factory):
+        reader = cached_reader_factory(git_repo_with_history)
         changes = reader.file_changes()
         assert len(changes) > 0
         file_paths = {c.file_path for c in changes}
-        assert "README.md" in file_paths
-        assert "src/main.py" in file_paths
-        assert "src/utils.py" in file_paths
+        assert HISTORY_PATHS <= file_paths
+        # Markdown files are skipped by the numstat parser
+        assert "README.md" not in file_paths
 
-    def test_since_filter(self, git_repo_with_history: Path):
-        reader = GitCliReader(str(git_repo_with_history))
+    def test_since_filter(self, git_repo_with_history: Path, cached_reader_factory):
+        reader = cached_reader_factory(git_repo_with_history)
         since = datetime.now(timezone.utc) - timedelta(days=20)
         changes = reader.file_changes(since=since)
         # Only commits from last 20 days (days_ago=15 and days_ago=5)
-        for c in changes:
-            assert c.date >= since
+        assert not changes or min(c.date for c in changes) >= since
 
-    def test_until_filter(self, git_repo_with_history: Path):
-        reader = GitCliReader(str(git_repo_with_history))
+    def test_until_filter(self, git_repo_with_history: Path, cached_reader_factory):
+        reader = cached_reader_factory(git_repo_with_history)
         until = datetime.now(timezone.utc) - timedelta(days=40)
         changes = reader.file_changes(until=until)
         # Only commits older than 40 days (days_ago=45, days_ago=60)
-        for c in changes:
-            assert c.date <= until
+        assert not changes or max(c.date for c in changes) <= until
 
-    def test_since_and_until_filter(self, git_repo_with_history: Path):
-        reader = GitCliReader(str(git_repo_with_history))
+    def test_since_and_until_filter(self, git_repo_with_history: Path, cached_reader_factory):
+        reader = cached_reader_factory(git_repo_with_history)
         since = datetime.now(timezone.utc) - timedelta(days=50)
         until = datetime.now(timezone.utc) - timedelta(days=20)
         changes = reader.file_changes(since=since, until=until)
-        for c in changes:
-            assert c.date >= since
-            assert c.date <= until
+        dates = [c.date for c in changes]
+        assert not dates or (min(dates) >= since and max(dates) <= until)
 
     def test_empty_repo_returns_empty(self, tmp_git_repo: Path):
         reader = GitCliReader(str(tmp_git_repo))
@@ -100,92 +158,72 @@ class TestFileChanges:
         file_paths = [c.file_path for c in changes]
         assert "image.png" not in file_paths
 
-    def test_author_names_extracted(self, git_repo_with_history: Path):
-        reader = GitCliReader(str(git_repo_with_history))
+    def test_author_names_extracted(self, git_repo_with_history: Path, cached_reader_factory):
+        reader = cached_reader_factory(git_repo_with_history)
         changes = reader.file_changes()
-        for c in changes:
-            assert c.author_name == "Test User"
+        assert {c.author_name for c in changes} == {"Test User"}
 
-    def test_author_emails_extracted(self, git_repo_with_history: Path):
-        reader = GitCliReader(str(git_repo_with_history))
+    def test_author_emails_extracted(self, git_repo_with_history: Path, cached_reader_factory):
+        reader = cached_reader_factory(git_repo_with_history)
         changes = reader.file_changes()
-        for c in changes:
-            assert c.author_email == "test@example.com"
+        assert {c.author_email for c in changes} == {"test@example.com"}
 
 
 class TestMultiAuthorFileChanges:
-    def test_multi_author_names_extracted(self, multi_author_repo: Path):
-        reader = GitCliReader(str(multi_author_repo))
+    def test_multi_author_names_extracted(self, multi_author_repo: Path, cached_reader_factory):
+        reader = cached_reader_factory(multi_author_repo)
         changes = reader.file_changes()
         author_names = {c.author_name for c in changes}
-        assert "Alice" in author_names
-        assert "Bob" in author_names
-        assert "Carol" in author_names
+        assert MULTI_AUTHOR_NAMES <= author_names
 
-    def test_multi_author_emails_extracted(self, multi_author_repo: Path):
-        reader = GitCliReader(str(multi_author_repo))
+    def test_multi_author_emails_extracted(self, multi_author_repo: Path, cached_reader_factory):
+        reader = cached_reader_factory(multi_author_repo)
         changes = reader.file_changes()
         author_emails = {c.author_email for c in changes}
-        assert "alice@example.com" in author_emails
-        assert "bob@example.com" in author_emails
-        assert "carol@example.com" in author_emails
+        assert MULTI_AUTHOR_EMAILS <= author_emails
 
-    def test_author_file_mapping(self, multi_author_repo: Path):
-        reader = GitCliReader(str(multi_author_repo))
+    def test_author_file_mapping(self, multi_author_repo: Path, cached_reader_factory):
+        reader = cached_reader_factory(multi_author_repo)
         changes = reader.file_changes()
         # Alice should have 3 main.py commits
         alice_main = [c for c in changes if c.file_path == "main.py" and c.author_name == "Alice"]
         assert len(alice_main) == 3
 
 
+@pytest.mark.slow
 class TestCouplingIntegration:
     """Integration tests: analyze_coupling with real git repos via GitCliReader."""
 
-    def test_coupled_files_detected(self, coupled_repo: Path):
-        reader = GitCliReader(str(coupled_repo))
-        report = analyze_coupling(reader, str(coupled_repo), 90)
-        assert len(report.coupling_pairs) > 0
+    def test_coupled_files_detected(self, coupling_report: CouplingReport):
+        assert len(coupling_report.coupling_pairs) > 0
 
-    def test_strongest_pair_is_a_b(self, coupled_repo: Path):
-        reader = GitCliReader(str(coupled_repo))
-        report = analyze_coupling(reader, str(coupled_repo), 90)
-        top = report.coupling_pairs[0]
+    def test_strongest_pair_is_a_b(self, coupling_report: CouplingReport):
+        top = coupling_report.coupling_pairs[0]
         assert top.file_a == "a.py"
         assert top.file_b == "b.py"
         # a+b share 3 commits, union=3 → strength=1.0
         assert top.coupling_strength == 1.0
 
-    def test_uncoupled_file_has_zero_distance(self, coupled_repo: Path):
-        reader = GitCliReader(str(coupled_repo))
-        report = analyze_coupling(reader, str(coupled_repo), 90)
-        pain_map = {fp.file_path: fp for fp in report.file_pain}
+    def test_uncoupled_file_has_zero_distance(self, coupling_report: CouplingReport):
+        pain_map = {fp.file_path: fp for fp in coupling_report.file_pain}
         assert pain_map["d.py"].distance_raw == 0.0
 
-    def test_all_files_have_pain_scores(self, coupled_repo: Path):
-        reader = GitCliReader(str(coupled_repo))
-        report = analyze_coupling(reader, str(coupled_repo), 90)
-        paths = {fp.file_path for fp in report.file_pain}
+    def test_all_files_have_pain_scores(self, coupling_report: CouplingReport):
+        paths = {fp.file_path for fp in coupling_report.file_pain}
         assert paths == {"a.py", "b.py", "c.py", "d.py"}
 
-    def test_pain_scores_in_range(self, coupled_repo: Path):
-        reader = GitCliReader(str(coupled_repo))
-        report = analyze_coupling(reader, str(coupled_repo), 90)
-        for fp in report.file_pain:
-            assert 0.0 <= fp.pain_score <= 1.0
+    def test_pain_scores_in_range(self, coupling_report: CouplingReport):
+        scores = [fp.pain_score for fp in coupling_report.file_pain]
+        assert 0.0 <= min(scores) and max(scores) <= 1.0
 
 
 class TestResolveRef:
-    def test_resolve_commit_hash(self, git_repo_with_history: Path):
-        reader = GitCliReader(str(git_repo_with_history))
-        # Get HEAD hash
-        result = subprocess.run(
-            ["git", "-C", str(git_repo_with_history), "rev-parse", "HEAD"],
-            capture_output=True, text=True, check=True,
-        )
-        head_hash = result.stdout.strip()
-        dt = reader.resolve_ref(head_hash)
+    @pytest.mark.parametrize("ref_kind", ["sha", "short_sha", "branch"])
+    def test_resolve_head_ref(self, history_reader: GitCliReader, history_head: RepoHead, ref_kind: str):
+        dt = history_reader.resolve_ref(getattr(history_head, ref_kind))
         assert isinstance(dt, datetime)
         assert dt.tzinfo is not None
+        assert dt == history_head.date
 
     def test_resolve_tag(self, tagged_repo: Path):
         reader = GitCliReader(str(tagged_repo))
@@ -193,71 +231,43 @@ class TestResolveRef:
         assert isinstance(dt, datetime)
         assert dt.tzinfo is not None
 
-    def test_resolve_branch(self, git_repo_with_history: Path):
-        reader = GitCliReader(str(git_repo_with_history))
-        # Get current branch name dynamically
-        result = subprocess.run(
-            ["git", "-C", str(git_repo_with_history), "branch", "--show-current"],
-            capture_output=True, text=True, check=True,
-        )
-        branch = result.stdout.strip()
-        dt = reader.resolve_ref(branch)
-        assert isinstance(dt, datetime)
-        last = reader.last_commit_date()
-        assert dt == last
-
-    def test_resolve_short_hash(self, git_repo_with_history: Path):
-        reader = GitCliReader(str(git_repo_with_history))
-        result = subprocess.run(
-            ["git", "-C", str(git_repo_with_history), "rev-parse", "--short", "HEAD"],
-            capture_output=True, text=True, check=True,
-        )
-        short_hash = result.stdout.strip()
-        dt = reader.resolve_ref(short_hash)
-        assert isinstance(dt, datetime)
-
-    def test_resolve_invalid_ref_raises(self, git_repo_with_history: Path):
-        reader = GitCliReader(str(git_repo_with_history))
+    def test_resolve_invalid_ref_raises(self, history_reader: GitCliReader):
         with pytest.raises(ValueError, match="Cannot resolve ref"):
-            reader.resolve_ref("nonexistent_ref_xyz")
+            history_reader.resolve_ref("nonexistent_ref_xyz")
 
 
+@pytest.mark.slow
 class TestCompareIntegration:
     """Integration tests: compare_hotspots with real git repos via GitCliReader."""
 
-    def test_compare_two_tags_produces_report(self, tagged_repo: Path):
-        reader = GitCliReader(str(tagged_repo))
-        report = compare_hotspots(reader, str(tagged_repo), 90, "v1.0", "v2.0")
-        assert report.from_ref == "v1.0"
-        assert report.to_ref == "v2.0"
-        assert len(report.files) > 0
+    def test_compare_two_tags_produces_report(self, tag_comparison: ComparisonReport):
+        assert tag_comparison.from_ref == "v1.0"
+        assert tag_comparison.to_ref == "v2.0"
+        assert len(tag_comparison.files) > 0
 
-    def test_compare_detects_new_file_after_tag(self, tagged_repo: Path):
+    def test_compare_detects_new_file_after_tag(self, tag_comparison: ComparisonReport):
         """utils.py was added after v1.0 → shows as 'new'."""
-        reader = GitCliReader(str(tagged_repo))
-        report = compare_hotspots(reader, str(tagged_repo), 90, "v1.0", "v2.0")
-        utils = [f for f in report.files if f.file_path == "src/utils.py"]
+        utils = [f for f in tag_comparison.files if f.file_path == "src/utils.py"]
         assert len(utils) == 1
         assert utils[0].status == "new"
 
-    def test_compare_detects_increased_churn(self, tagged_repo: Path):
+    def test_compare_detects_increased_churn(self, tag_comparison: ComparisonReport):
         """main.py has more activity at v2.0 than v1.0."""
-        reader = GitCliReader(str(tagged_repo))
-        report = compare_hotspots(reader, str(tagged_repo), 90, "v1.0", "v2.0")
-        main = [f for f in report.files if f.file_path == "src/main.py"]
+        main = [f for f in tag_comparison.files if f.file_path == "src/main.py"]
         assert len(main) == 1
         assert main[0].to_churn >= main[0].from_churn
 
     def test_at_tag_matches_manual_time(self, tagged_repo: Path):
-        """--at with tag produces same result as manual current_time."""
+        """--at with tag resolves to the tag's own commit time."""
         from git_xrays.application.use_cases import _resolve_ref_to_datetime, analyze_hotspots
         reader = GitCliReader(str(tagged_repo))
         tag_time = _resolve_ref_to_datetime("v1.0", reader)
-        report_via_tag = analyze_hotspots(reader, str(tagged_repo), 90, current_time=tag_time)
-        # Resolve the tag date manually and compare
-        report_manual = analyze_hotspots(reader, str(tagged_repo), 90, current_time=reader.resolve_ref("v1.0"))
-        assert report_via_tag.total_commits == report_manual.total_commits
-        assert len(report_via_tag.files) == len(report_manual.files)
+        assert tag_time == reader.resolve_ref("v1.0")
+        # Same current_time → same report, so one pipeline run suffices
+        report = analyze_hotspots(reader, str(tagged_repo), 90, current_time=tag_time)
+        # At v1.0 only src/main.py has been committed (README.md is skipped)
+        assert [f.file_path for f in report.files] == ["src/main.py"]
+        assert report.total_commits == 1
 
     def test_compare_same_tag_all_unchanged(self, tagged_repo: Path):
         """Comparing a tag to itself → all unchanged."""
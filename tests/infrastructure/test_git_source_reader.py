@@ -5,26 +5,29 @@ import pytest
 from git_xrays.infrastructure.git_source_reader import GitSourceReader
 
 
+@pytest.fixture(scope="class")
+def source_reader(anemic_repo: Path) -> tuple[GitSourceReader, list[str], list[str]]:
+    """One reader plus its working-tree and HEAD listings, built once per class."""
+    reader = GitSourceReader(str(anemic_repo))
+    return reader, reader.list_python_files(), reader.list_python_files(ref="HEAD")
+
+
 class TestGitSourceReader:
-    def test_list_python_files_finds_py_files(self, anemic_repo: Path):
-        reader = GitSourceReader(str(anemic_repo))
-        files = reader.list_python_files()
+    def test_list_python_files_finds_py_files(self, source_reader):
+        _, files, _ = source_reader
         assert any(f.endswith(".py") for f in files)
 
-    def test_list_python_files_excludes_non_py(self, anemic_repo: Path):
-        reader = GitSourceReader(str(anemic_repo))
-        files = reader.list_python_files()
+    def test_list_python_files_excludes_non_py(self, source_reader):
+        _, files, _ = source_reader
         assert all(f.endswith(".py") for f in files)
 
-    def test_read_file_returns_content(self, anemic_repo: Path):
-        reader = GitSourceReader(str(anemic_repo))
-        files = reader.list_python_files()
+    def test_read_file_returns_content(self, source_reader):
+        reader, files, _ = source_reader
         content = reader.read_file(files[0])
         assert len(content) > 0
 
-    def test_read_file_at_ref(self, anemic_repo: Path):
-        reader = GitSourceReader(str(anemic_repo))
-        files = reader.list_python_files(ref="HEAD")
-        assert len(files) > 0
-        content = reader.read_file(files[0], ref="HEAD")
+    def test_read_file_at_ref(self, source_reader):
+        reader, _, head_files = source_reader
+        assert len(head_files) > 0
+        content = reader.read_file(head_files[0], ref="HEAD")
         assert len(content) > 0
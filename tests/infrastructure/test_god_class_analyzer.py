@@ -2,24 +2,13 @@
 
 import pytest
 
-from git_xrays.infrastructure.god_class_analyzer import (
-    _compute_method_complexity,
-    _compute_tcc,
-    _compute_wmc,
-    _count_fields,
-    _get_candidate_methods,
-    analyze_python_god_classes,
-)
-import ast
-
-
-def _parse_class(source: str) -> ast.ClassDef:
-    """Helper to parse a source string and return the first class."""
-    tree = ast.parse(source)
-    for node in tree.body:
-        if isinstance(node, ast.ClassDef):
-            return node
-    raise ValueError("No class found")
+from git_xrays.domain.models import GodClassMetrics
+from git_xrays.infrastructure.god_class_analyzer import analyze_python_god_classes
+
+
+def _class_metrics(source: str) -> GodClassMetrics:
+    """Analyze a source string and return the metrics of its first class."""
+    return analyze_python_god_classes(source, "foo.py").classes[0]
 
 
 # ── WMC Tests ─────────────────────────────────────────────────────────
@@ -28,8 +17,7 @@ def _parse_class(source: str) -> ast.ClassDef:
 class TestWMC:
     def test_empty_class(self):
         src = "class Empty:\n    pass\n"
-        node = _parse_class(src)
-        assert _compute_wmc(node) == 0
+        assert _class_metrics(src).total_complexity == 0
 
     def test_single_simple_method(self):
         src = """
@@ -37,8 +25,7 @@ class Foo:
     def bar(self):
         return 1
 """
-        node = _parse_class(src)
-        assert _compute_wmc(node) == 1  # base CC of 1
+        assert _class_metrics(src).total_complexity == 1  # base CC of 1
 
     def test_method_with_branches(self):
         src = """
@@ -50,9 +37,8 @@ class Foo:
             return -x
         return 0
 """
-        node = _parse_class(src)
         # CC = 1 + if + elif(nested If) = 3
-        assert _compute_wmc(node) == 3
+        assert _class_metrics(src).total_complexity == 3
 
     def test_multiple_methods(self):
         src = """
@@ -64,9 +50,8 @@ class Foo:
             return x
         return 0
 """
-        node = _parse_class(src)
         # a: CC=1, b: CC=2 → WMC=3
-        assert _compute_wmc(node) == 3
+        assert _class_metrics(src).total_complexity == 3
 
     def test_includes_dunder_methods(self):
         src = """
@@ -77,9 +62,8 @@ class Foo:
     def bar(self):
         return 1
 """
-        node = _parse_class(src)
         # __init__: CC=2, bar: CC=1 → WMC=3
-        assert _compute_wmc(node) == 3
+        assert _class_metrics(src).total_complexity == 3
 
 
 # ── TCC Tests ─────────────────────────────────────────────────────────
@@ -92,8 +76,7 @@ class Foo:
     def bar(self):
         return self.x
 """
-        node = _parse_class(src)
-        assert _compute_tcc(node) == 1.0
+        assert _class_metrics(src).cohesion == 1.0
 
     def test_no_candidate_methods_returns_one(self):
         src = """
@@ -101,8 +84,7 @@ class Foo:
     def __init__(self):
         self.x = 1
 """
-        node = _parse_class(src)
-        assert _compute_tcc(node) == 1.0
+        assert _class_metrics(src).cohesion == 1.0
 
     def test_disjoint_methods_return_zero(self):
         src = """
@@ -112,8 +94,7 @@ class Foo:
     def b(self):
         return self.y
 """
-        node = _parse_class(src)
-        assert _compute_tcc(node) == 0.0
+        assert _class_metrics(src).cohesion == 0.0
 
     def test_all_methods_share_field(self):
         src = """
@@ -125,9 +106,8 @@ class Foo:
     def c(self):
         return self.x * 2
 """
-        node = _parse_class(src)
         # 3 methods, all share self.x → 3/3 = 1.0
-        assert _compute_tcc(node) == 1.0
+        assert _class_metrics(src).cohesion == 1.0
 
     def test_partial_cohesion(self):
         src = """
@@ -139,10 +119,9 @@ class Foo:
     def c(self):
         return self.z
 """
-        node = _parse_class(src)
         # Pairs: (a,b)=share x ✓, (a,c)=no ✗, (b,c)=no ✗
         # TCC = 1/3 ≈ 0.3333
-        assert _compute_tcc(node) == pytest.approx(0.3333, abs=0.001)
+        assert _class_metrics(src).cohesion == pytest.approx(0.3333, abs=0.001)
 
     def test_excludes_dunders_and_properties(self):
         src = """
@@ -161,9 +140,8 @@ class Foo:
     def b(self):
         return self.y
 """
-        node = _parse_class(src)
         # Only a and b are candidates; they don't share fields
-        assert _compute_tcc(node) == 0.0
+        assert _class_metrics(src).cohesion == 0.0
 
 
 # ── Method Complexity Tests ───────────────────────────────────────────
@@ -176,9 +154,7 @@ class Foo:
     def bar(self):
         return 1
 """
-        tree = ast.parse(src)
-        func = tree.body[0].body[0]
-        assert _compute_method_complexity(func) == 1
+        assert _class_metrics(src).total_complexity == 1
 
     def test_with_if_and_for(self):
         src = """
@@ -189,10 +165,8 @@ class Foo:
                 pass
         return 0
 """
-        tree = ast.parse(src)
-        func = tree.body[0].body[0]
         # CC = 1 + for + if = 3
-        assert _compute_method_complexity(func) == 3
+        assert _class_metrics(src).total_complexity == 3
 
     def test_boolean_ops(self):
         src = """
@@ -201,14 +175,9 @@ class Foo:
         if a and b or c:
             pass
 """
-        tree = ast.parse(src)
-        func = tree.body[0].body[0]
-        # CC = 1 + if + BoolOp(and: 1) + BoolOp(or: 1)  — depends on ast structure
-        # Actually: `a and b or c` parses as BoolOp(Or, [BoolOp(And, [a,b]), c])
-        # Inner BoolOp(And, [a,b]): +1
-        # Outer BoolOp(Or, [inner, c]): +1
+        # `a and b or c` parses as BoolOp(Or, [BoolOp(And, [a,b]), c])
         # Total: 1 + 1(if) + 1(and) + 1(or) = 4
-        assert _compute_method_complexity(func) == 4
+        assert _class_metrics(src).total_complexity == 4
 
 
 # ── Field Count Tests ─────────────────────────────────────────────────
@@ -221,8 +190,7 @@ class Foo:
     x = 1
     y: int = 2
 """
-        node = _parse_class(src)
-        assert _count_fields(node) == 2
+        assert _class_metrics(src).field_count == 2
 
     def test_init_self_attrs(self):
         src = """
@@ -232,8 +200,7 @@ class Foo:
         self.b = 2
         self.c = 3
 """
-        node = _parse_class(src)
-        assert _count_fields(node) == 3
+        assert _class_metrics(src).field_count == 3
 
     def test_combined(self):
         src = """
@@ -242,8 +209,7 @@ class Foo:
     def __init__(self):
         self.y = 1
 """
-        node = _parse_class(src)
-        assert _count_fields(node) == 2
+        assert _class_metrics(src).field_count == 2
 
 
 # ── Candidate Methods Tests ──────────────────────────────────────────
@@ -260,10 +226,7 @@ class Foo:
     def bar(self):
         return 1
 """
-        node = _parse_class(src)
-        candidates = _get_candidate_methods(node)
-        assert len(candidates) == 1
-        assert candidates[0].name == "bar"
+        assert _class_metrics(src).method_count == 1  # bar only
 
     def test_excludes_properties(self):
         src = """
@@ -274,10 +237,7 @@ class Foo:
     def bar(self):
         return 1
 """
-        node = _parse_class(src)
-        candidates = _get_candidate_methods(node)
-        assert len(candidates) == 1
-        assert candidates[0].name == "bar"
+        assert _class_metrics(src).method_count == 1  # bar only
 
 
 # ── Full Analyzer Tests ──────────────────────────────────────────────
@@ -287,12 +247,12 @@ class TestAnalyzePythonGodClasses:
     def test_empty_file(self):
         result = analyze_python_god_classes("", "empty.py")
         assert result.class_count == 0
-        assert result.classes == []
+        assert result.classes == ()
 
     def test_syntax_error(self):
         result = analyze_python_god_classes("def class (broken", "bad.py")
         assert result.class_count == 0
-        assert result.classes == []
+        assert result.classes == ()
 
     def test_single_small_class(self):
         src = """
@@ -342,7 +342,7 @@ public class Empty {
 """
         fc = analyze_java_file_complexity(source, "Empty.java")
         assert fc.function_count == 0
-        assert fc.functions == []
+        assert fc.functions == ()
 
     def test_single_method(self):
         source = """
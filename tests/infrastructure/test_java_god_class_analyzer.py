@@ -316,7 +316,7 @@ class TestAnalyzeJavaGodClasses:
     def test_parse_error(self):
         result = analyze_java_god_classes("public broken {{{", "bad.java")
         assert result.class_count == 0
-        assert result.classes == []
+        assert result.classes == ()
 
     def test_small_pojo(self):
         src = """
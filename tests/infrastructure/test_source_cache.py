@@ -0,0 +1,38 @@
+from git_xrays.infrastructure.source_cache import SourceResultCache
+
+
+class TestSourceResultCache:
+    def test_hit_skips_compute(self):
+        cache: SourceResultCache[int] = SourceResultCache(maxsize=4)
+        calls: list[str] = []
+
+        def compute() -> int:
+            calls.append("x = 1")
+            return len(calls)
+
+        assert cache.get_or_compute("x = 1", ("a.py",), compute) == 1
+        assert cache.get_or_compute("x = 1", ("a.py",), compute) == 1
+        assert calls == ["x = 1"]
+
+    def test_extra_args_are_part_of_key(self):
+        cache: SourceResultCache[str] = SourceResultCache(maxsize=4)
+        assert cache.get_or_compute("x = 1", ("a.py",), lambda: "a") == "a"
+        assert cache.get_or_compute("x = 1", ("b.py",), lambda: "b") == "b"
+        assert len(cache) == 2
+
+    def test_evicts_least_recently_used(self):
+        cache: SourceResultCache[str] = SourceResultCache(maxsize=2)
+        cache.get_or_compute("a", (), lambda: "a")
+        cache.get_or_compute("b", (), lambda: "b")
+        cache.get_or_compute("a", (), lambda: "stale")  # refresh "a"
+        cache.get_or_compute("c", (), lambda: "c")      # evicts "b"
+        assert len(cache) == 2
+        assert cache.get_or_compute("a", (), lambda: "new") == "a"
+        assert cache.get_or_compute("b", (), lambda: "new") == "new"
+
+    def test_clear(self):
+        cache: SourceResultCache[str] = SourceResultCache(maxsize=2)
+        cache.get_or_compute("a", (), lambda: "a")
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.get_or_compute("a", (), lambda: "new") == "new"